@@ -32,12 +32,103 @@ Enhanced logger that can be used by addons with their own log directories.
 Uses the same logger_config.py from geo_mail but allows custom log directories.
 """
 
+import functools
+import heapq
 import logging
 import os
 import sys
 import shutil
 from datetime import datetime
-from typing import Optional
+from operator import itemgetter
+from typing import Dict, Optional
+
+# Directory of the addons and the geo_mail modules (for config_manager)
+ADDONS_DIR = os.path.dirname(os.path.abspath(__file__))
+GEO_MAIL_MODULES_DIR = os.path.join(os.path.dirname(ADDONS_DIR), "modules")
+
+# Buffer size for log file streams; records are written to disk in batches
+LOG_BUFFER_SIZE = 65536
+
+# None of the formats below use thread/process fields; skip collecting them per record
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+
+class LevelFileHandler(logging.Handler):
+    """
+    Write each record to the log file of its own level and to all.log.
+    
+    Replaces one FileHandler + filter per level: every file is opened once with
+    a large write buffer, a record is formatted once and routed with a single
+    dict lookup on its levelno. Buffers are flushed for records at or above
+    flush_level, on flush()/close() and at interpreter exit (logging.shutdown).
+    """
+    
+    def __init__(self, level_files: Dict[str, str], all_file: Optional[str] = None,
+                 flush_level: int = logging.ERROR, buffer_size: int = LOG_BUFFER_SIZE):
+        """
+        Args:
+            level_files: Mapping of level name (e.g. 'INFO') to log file path
+            all_file: Path of the log file receiving every record (optional)
+            flush_level: Records at or above this level are flushed immediately
+            buffer_size: Write buffer size of each log file
+        """
+        super().__init__()
+        self.flush_level = flush_level
+        self.streams = {
+            getattr(logging, level): open(path, "a", buffering=buffer_size, encoding="utf-8")
+            for level, path in level_files.items()
+        }
+        self.all_stream = open(all_file, "a", buffering=buffer_size, encoding="utf-8") if all_file else None
+    
+    def emit(self, record):
+        stream = self.streams.get(record.levelno)
+        if stream is None and self.all_stream is None:
+            return
+        try:
+            msg = self.format(record) + "\n"
+            if stream is not None:
+                stream.write(msg)
+            if self.all_stream is not None:
+                self.all_stream.write(msg)
+            if record.levelno >= self.flush_level:
+                self.flush()
+        except Exception:
+            self.handleError(record)
+    
+    def write_header(self, header: str):
+        """Write raw text (not a formatted record) to every log file."""
+        self.acquire()
+        try:
+            for stream in self.streams.values():
+                stream.write(header)
+            if self.all_stream is not None:
+                self.all_stream.write(header)
+        finally:
+            self.release()
+    
+    def flush(self):
+        self.acquire()
+        try:
+            for stream in self.streams.values():
+                stream.flush()
+            if self.all_stream is not None:
+                self.all_stream.flush()
+        finally:
+            self.release()
+    
+    def close(self):
+        self.acquire()
+        try:
+            for stream in self.streams.values():
+                stream.close()
+            if self.all_stream is not None:
+                self.all_stream.close()
+            self.streams = {}
+            self.all_stream = None
+        finally:
+            self.release()
+        super().close()
 
 def setup_addon_logging(addon_name: str, custom_log_dir: Optional[str] = None):
     """
@@ -56,7 +147,7 @@ def setup_addon_logging(addon_name: str, custom_log_dir: Optional[str] = None):
         log_dir = custom_log_dir
     else:
         # Default: addon's own logs directory
-        addon_dir = os.path.dirname(os.path.abspath(__file__))
+        addon_dir = ADDONS_DIR
         if addon_name in addon_dir:
             # We're in the addon directory
             log_dir = os.path.join(addon_dir, "logs")
@@ -65,36 +156,15 @@ def setup_addon_logging(addon_name: str, custom_log_dir: Optional[str] = None):
             geo_mail_root = os.path.dirname(addon_dir)
             log_dir = os.path.join(geo_mail_root, "addons", addon_name, "logs")
     
-    # Create logs directory if it doesn't exist
-    if not os.path.exists(log_dir):
-        os.makedirs(log_dir)
-    
     # Generate timestamped run folder
     timestamp = datetime.now().strftime("%Y-%m-%d_%H%M%S")
     run_folder = os.path.join(log_dir, timestamp)
+    # Creates the logs directory too; no separate existence check needed
     os.makedirs(run_folder, exist_ok=True)
     
-    # Default logging configuration (can be overridden by config)
-    console_level = "INFO"
-    file_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
-    max_log_files = 10
-    
-    # Try to load configuration from geo_mail config if available
-    try:
-        # Add geo_mail modules to path
-        geo_mail_modules = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "modules")
-        if geo_mail_modules not in sys.path:
-            sys.path.insert(0, geo_mail_modules)
-        
-        from config_manager import ConfigManager
-        config_manager = ConfigManager()
-        
-        console_level = config_manager.get("Logging", "console_level", fallback="INFO").upper()
-        file_levels = [level.strip().upper() for level in config_manager.get("Logging", "file_levels", fallback="DEBUG,INFO,WARNING,ERROR,CRITICAL").split(",")]
-        max_log_files = config_manager.getint("Logging", "max_log_files_to_keep", fallback=10)
-        
-    except Exception as e:
-        print(f"Warning: Could not load geo_mail config, using defaults: {e}")
+    # Logging configuration (parsed once per process)
+    console_level, file_levels, max_log_files = _load_log_config()
+    file_levels = list(file_levels)
     
     # Clear any existing handlers for this logger
     logger_name = f"addon.{addon_name}"
@@ -103,26 +173,24 @@ def setup_addon_logging(addon_name: str, custom_log_dir: Optional[str] = None):
     # Clear existing handlers
     for handler in addon_logger.handlers[:]:
         addon_logger.removeHandler(handler)
+        handler.close()
     
-    # Set up file handlers for each log level
-    file_handlers = []
+    # Set up a single buffered handler for the per-level files and all.log
+    file_formatter = logging.Formatter(
+        f"%(asctime)s - %(levelname)s - {addon_name} - %(module)s - %(message)s"
+    )
     log_files = {}
     
     for level in file_levels:
         if level in ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]:
-            log_file = os.path.join(run_folder, f"{level.lower()}.log")
-            log_files[level] = log_file
-            
-            # Create file handler
-            file_handler = logging.FileHandler(log_file)
-            file_handler.setLevel(getattr(logging, level))
-            file_handler.setFormatter(logging.Formatter(
-                f"%(asctime)s - %(levelname)s - {addon_name} - %(module)s - %(message)s"
-            ))
-            
-            # Add filter to only show this level
-            file_handler.addFilter(lambda record, lvl=level: record.levelname == lvl)
-            file_handlers.append(file_handler)
+            log_files[level] = os.path.join(run_folder, f"{level.lower()}.log")
+    
+    # Create "all" log file that contains everything
+    all_log_file = os.path.join(run_folder, "all.log")
+    
+    file_handler = LevelFileHandler(log_files, all_log_file)
+    file_handler.setLevel(logging.DEBUG)
+    file_handler.setFormatter(file_formatter)
     
     # Create console handler with configured level
     console_handler = logging.StreamHandler()
@@ -134,32 +202,18 @@ def setup_addon_logging(addon_name: str, custom_log_dir: Optional[str] = None):
         f"%(asctime)s - %(levelname)s - {addon_name} - %(message)s"
     ))
     
-    # Create "all" log file that contains everything
-    all_log_file = os.path.join(run_folder, "all.log")
-    log_files["ALL"] = all_log_file
-    all_handler = logging.FileHandler(all_log_file)
-    all_handler.setLevel(logging.DEBUG)
-    all_handler.setFormatter(logging.Formatter(
-        f"%(asctime)s - %(levelname)s - {addon_name} - %(module)s - %(message)s"
-    ))
-    
     # Configure addon logger
     addon_logger.setLevel(logging.DEBUG)
     addon_logger.propagate = False  # Don't propagate to root logger
     
-    for handler in file_handlers:
-        addon_logger.addHandler(handler)
-    addon_logger.addHandler(all_handler)
+    addon_logger.addHandler(file_handler)
     addon_logger.addHandler(console_handler)
     
-    # Write CLI command and configuration to all log files
+    # Write CLI command and configuration to all log files through the open streams
     cli_command = " ".join(sys.argv)
     config_info = f"Console Level: {console_level}, File Levels: {file_levels}"
     header = f"Addon: {addon_name}\nCLI Command: {cli_command}\nLogging Config: {config_info}\n{'=' * 80}\n\n"
-    
-    for log_file in log_files.values():
-        with open(log_file, "w") as f:
-            f.write(header)
+    file_handler.write_header(header)
     
     addon_logger.info(f"Addon logging initialized for {addon_name}")
     addon_logger.info(f"Log directory: {run_folder}")
@@ -172,25 +226,60 @@ def setup_addon_logging(addon_name: str, custom_log_dir: Optional[str] = None):
     
     return addon_logger
 
+@functools.lru_cache(maxsize=1)
+def _load_log_config():
+    """
+    Load logging settings from the geo_mail config, falling back to defaults.
+    
+    Cached so the INI file is parsed only once however many addons set up logging.
+    
+    Returns:
+        Tuple of (console_level, file_levels, max_log_files)
+    """
+    # Default logging configuration (can be overridden by config)
+    console_level = "INFO"
+    file_levels = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+    max_log_files = 10
+    
+    # Try to load configuration from geo_mail config if available
+    try:
+        # Add geo_mail modules to path
+        if GEO_MAIL_MODULES_DIR not in sys.path:
+            sys.path.insert(0, GEO_MAIL_MODULES_DIR)
+        
+        from config_manager import ConfigManager
+        config_manager = ConfigManager()
+        
+        console_level = config_manager.get("Logging", "console_level", fallback="INFO").upper()
+        file_levels = tuple(level.strip().upper() for level in config_manager.get("Logging", "file_levels", fallback="DEBUG,INFO,WARNING,ERROR,CRITICAL").split(","))
+        max_log_files = config_manager.getint("Logging", "max_log_files_to_keep", fallback=10)
+        
+    except Exception as e:
+        print(f"Warning: Could not load geo_mail config, using defaults: {e}")
+    
+    return console_level, file_levels, max_log_files
+
 def _cleanup_old_logs(log_dir, max_files_to_keep, logger):
     """Clean up old log folders, keeping only the most recent ones."""
     try:
-        if not os.path.exists(log_dir):
+        # Get all timestamped folders (YYYY-MM-DD_HHMMSS format);
+        # scandir entries carry the file type, so only matching folders are stat'ed
+        try:
+            with os.scandir(log_dir) as entries:
+                log_folders = [
+                    (entry.path, entry.stat().st_ctime)
+                    for entry in entries
+                    if entry.is_dir() and _is_valid_log_folder(entry.name)
+                ]
+        except FileNotFoundError:
             return
         
-        # Get all timestamped folders (YYYY-MM-DD_HHMMSS format)
-        log_folders = []
-        for item in os.listdir(log_dir):
-            item_path = os.path.join(log_dir, item)
-            if os.path.isdir(item_path) and _is_valid_log_folder(item):
-                log_folders.append((item_path, os.path.getctime(item_path)))
-        
-        # Sort by creation time (newest first)
-        log_folders.sort(key=lambda x: x[1], reverse=True)
-        
-        # Remove old folders if we exceed the limit
+        # Remove the oldest folders (by creation time) beyond the limit;
+        # only the removal candidates are selected, no full sort needed
         if len(log_folders) > max_files_to_keep:
-            folders_to_remove = log_folders[max_files_to_keep:]
+            folders_to_remove = heapq.nsmallest(
+                len(log_folders) - max_files_to_keep, log_folders, key=itemgetter(1)
+            )
             for folder_path, _ in folders_to_remove:
                 try:
                     shutil.rmtree(folder_path)
@@ -203,6 +292,10 @@ def _cleanup_old_logs(log_dir, max_files_to_keep, logger):
 
 def _is_valid_log_folder(folder_name):
     """Check if folder name matches the expected timestamped format: YYYY-MM-DD_HHMMSS."""
+    # Cheap shape check first so unrelated entries never reach strptime
+    if len(folder_name) != 17 or folder_name[4] != '-' or folder_name[7] != '-' or folder_name[10] != '_':
+        return False
+    
     try:
         # Try to parse the folder name as a timestamp
         datetime.strptime(folder_name, "%Y-%m-%d_%H%M%S")
@@ -31,10 +31,15 @@ Addon Manager
 Central manager for all email addons with unified interfaces for single and batch processing.
 """
 
+import importlib
+import logging
 import os
 import sys
-from typing import List, Dict, Any, Optional, Union
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import threading
+from collections import defaultdict
+from itertools import repeat
+from typing import List, Dict, Any, Optional, Tuple, Union
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait, FIRST_EXCEPTION
 
 # Add current directory to path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
@@ -42,6 +47,74 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 from base_addon import EmailFinderAddon, EmailCheckerAddon, CompanyInfo, EmailResult
 from database_manager import EmailDatabaseManager
 
+logger = logging.getLogger(__name__)
+
+# Addon name -> (module, class, description, config key)
+FINDER_ADDONS = {
+    'static': ('static_generator', 'StaticEmailGenerator', 'static generator', 'static'),
+    'harvester': ('mail_harvester', 'MailHarvesterAddon', 'mail harvester', 'harvester'),
+    'scraper': ('mail_scraper', 'MailScraperAddon', 'mail scraper', 'scraper'),
+}
+CHECKER_ADDONS = {
+    'checker': ('mail_checker', 'MailCheckerAddon', 'mail checker', 'checker'),
+}
+
+class _LazyAddons(dict):
+    """
+    Addon instances keyed by name, imported and created on first access.
+    
+    Importing an addon pulls in its own dependencies (requests, subprocess
+    wrappers, ...), so callers only pay for the addons they actually use.
+    """
+    
+    def __init__(self, specs: Dict[str, tuple], config: Dict[str, Any]):
+        super().__init__()
+        self._specs = specs
+        self._config = config
+        self._failed = set()
+        self._lock = threading.Lock()
+    
+    def available(self) -> List[str]:
+        """Names of addons that are registered and have not failed to load (yet)."""
+        return [name for name in self._specs if name not in self._failed]
+    
+    def loadable(self) -> List[str]:
+        """Names of addons that load; imports the ones not loaded yet."""
+        return [name for name in self._specs if name in self]
+    
+    def _load(self, name: str) -> bool:
+        """Import and instantiate an addon; returns True if it is loaded."""
+        if name not in self._specs:
+            return False
+        
+        with self._lock:
+            if dict.__contains__(self, name):
+                return True
+            if name in self._failed:
+                return False
+            
+            module_name, class_name, description, config_key = self._specs[name]
+            try:
+                module = importlib.import_module(module_name)
+                addon_class = getattr(module, class_name)
+                dict.__setitem__(self, name, addon_class(self._config.get(config_key, {})))
+                return True
+            except ImportError as e:
+                print(f"Could not load {description}: {e}")
+                self._failed.add(name)
+                return False
+    
+    def __contains__(self, name) -> bool:
+        return dict.__contains__(self, name) or self._load(name)
+    
+    def __missing__(self, name):
+        if self._load(name):
+            return dict.__getitem__(self, name)
+        raise KeyError(name)
+    
+    def get(self, name, default=None):
+        return self[name] if name in self else default
+
 class AddonManager:
     """
     Central manager for all email addons.
@@ -61,13 +134,28 @@ class AddonManager:
         self.config = config or {}
         self.db_path = db_path
         self.db_manager = EmailDatabaseManager(db_path, id_column) if db_path else None
-        self.finder_addons = {}
-        self.checker_addons = {}
         self.max_workers = self.config.get('max_workers', 5)
+        # Reused by every find_emails_batch call; threads start on first submit
+        self._finder_pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="finder")
 
         self._load_addons()
         self._ensure_database_setup()
 
+    def close(self):
+        """Shut down the finder thread pool, clean up loaded addons and close the database connection."""
+        self._finder_pool.shutdown(wait=True)
+        # values() only holds addons that were actually loaded
+        for addon in (*self.finder_addons.values(), *self.checker_addons.values()):
+            addon.cleanup()
+        if self.db_manager:
+            self.db_manager.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
     def _ensure_database_setup(self):
         """Ensure database tables are properly set up."""
         if self.db_manager:
@@ -75,46 +163,17 @@ class AddonManager:
             self.db_manager.ensure_companies_table_columns()
     
     def _load_addons(self):
-        """Load all available addons."""
-        # Load static generator
-        try:
-            from static_generator import StaticEmailGenerator
-            static_config = self.config.get('static', {})
-            self.finder_addons['static'] = StaticEmailGenerator(static_config)
-        except ImportError as e:
-            print(f"Could not load static generator: {e}")
-        
-        # Load mail harvester
-        try:
-            from mail_harvester import MailHarvesterAddon
-            harvester_config = self.config.get('harvester', {})
-            self.finder_addons['harvester'] = MailHarvesterAddon(harvester_config)
-        except ImportError as e:
-            print(f"Could not load mail harvester: {e}")
-        
-        # Load mail scraper
-        try:
-            from mail_scraper import MailScraperAddon
-            scraper_config = self.config.get('scraper', {})
-            self.finder_addons['scraper'] = MailScraperAddon(scraper_config)
-        except ImportError as e:
-            print(f"Could not load mail scraper: {e}")
-        
-        # Load mail checker
-        try:
-            from mail_checker import MailCheckerAddon
-            checker_config = self.config.get('checker', {})
-            self.checker_addons['checker'] = MailCheckerAddon(checker_config)
-        except ImportError as e:
-            print(f"Could not load mail checker: {e}")
+        """Register all available addons; each is imported on first use."""
+        self.finder_addons = _LazyAddons(FINDER_ADDONS, self.config)
+        self.checker_addons = _LazyAddons(CHECKER_ADDONS, self.config)
     
     def get_available_finders(self) -> List[str]:
-        """Get list of available email finder addons."""
-        return list(self.finder_addons.keys())
+        """Get list of available email finder addons (without importing them)."""
+        return self.finder_addons.available()
     
     def get_available_checkers(self) -> List[str]:
-        """Get list of available email checker addons."""
-        return list(self.checker_addons.keys())
+        """Get list of available email checker addons (without importing them)."""
+        return self.checker_addons.available()
     
     def find_emails_single(self, company: CompanyInfo, methods: List[str] = None) -> Dict[str, List[EmailResult]]:
         """
@@ -122,75 +181,118 @@ class AddonManager:
         
         Args:
             company: Company information
-            methods: List of methods to use (defaults to all available)
+            methods: List of methods to use (defaults to all that load)
             
         Returns:
             Dictionary mapping method name to list of EmailResult objects
         """
         if methods is None:
-            methods = self.get_available_finders()
+            methods = self.finder_addons.loadable()
         
-        results = {}
+        return self._find_emails_resolved(company, self._resolve_finders(methods))
+    
+    def _resolve_finders(self, methods: List[str]) -> List[Tuple[str, Optional[EmailFinderAddon]]]:
+        """
+        Look up the addon for each method once, so batches don't repeat it per company.
         
+        Args:
+            methods: List of method names
+            
+        Returns:
+            List of (method, addon) pairs; addon is None for unavailable methods
+        """
+        resolved = []
         for method in methods:
             if method in self.finder_addons:
-                addon = self.finder_addons[method]
-                
-                if addon.validate_company(company):
-                    try:
-                        emails = addon.find_emails(company)
-                        results[method] = emails
-                        print(f"Found {len(emails)} emails using {method} for company {company.id}")
-                    except Exception as e:
-                        print(f"Error using {method} for company {company.id}: {e}")
-                        results[method] = []
-                else:
-                    print(f"Company {company.id} not valid for {method} addon")
+                resolved.append((method, self.finder_addons[method]))
+            else:
+                logger.warning(f"Method {method} not available")
+                resolved.append((method, None))
+        return resolved
+    
+    def _find_emails_resolved(self, company: CompanyInfo,
+                              resolved: List[Tuple[str, Optional[EmailFinderAddon]]],
+                              fail_fast: bool = False) -> Dict[str, List[EmailResult]]:
+        """
+        Find emails for a single company with already resolved (method, addon) pairs.
+        
+        A failing method gets an empty list, unless fail_fast is set, in which
+        case its exception is raised.
+        """
+        results = {}
+        
+        for method, addon in resolved:
+            if addon is None:
+                results[method] = []
+            elif addon.validate_company(company):
+                try:
+                    emails = addon.find_emails(company)
+                    results[method] = emails
+                    logger.debug(f"Found {len(emails)} emails using {method} for company {company.id}")
+                except Exception as e:
+                    if fail_fast:
+                        raise
+                    logger.warning(f"Error using {method} for company {company.id}: {e}")
                     results[method] = []
             else:
-                print(f"Method {method} not available")
+                logger.debug(f"Company {company.id} not valid for {method} addon")
                 results[method] = []
         
         return results
     
     def find_emails_batch(self, companies: List[CompanyInfo], methods: List[str] = None, 
-                         use_threading: bool = True) -> Dict[int, Dict[str, List[EmailResult]]]:
+                         use_threading: bool = True, fail_fast: bool = False) -> Dict[int, Dict[str, List[EmailResult]]]:
         """
         Find emails for multiple companies using specified methods.
         
         Args:
             companies: List of company information
-            methods: List of methods to use (defaults to all available)
+            methods: List of methods to use (defaults to all that load)
             use_threading: Whether to use threading for parallel processing
+            fail_fast: Stop on the first failed company and cancel the ones not
+                yet started (threaded mode only); companies already running
+                are finished, cancelled ones are left out of the results
             
         Returns:
             Dictionary mapping company_id to method results
         """
         if methods is None:
-            methods = self.get_available_finders()
+            # Addons whose import fails are left out rather than reported per company
+            methods = self.finder_addons.loadable()
         
         all_results = {}
+        resolved = self._resolve_finders(methods)
         
         if use_threading and len(companies) > 1:
             # Use threading for parallel processing
-            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-                future_to_company = {
-                    executor.submit(self.find_emails_single, company, methods): company
-                    for company in companies
-                }
-                
-                for future in as_completed(future_to_company):
-                    company = future_to_company[future]
-                    try:
-                        results = future.result()
-                        all_results[company.id] = results
-                    except Exception as e:
-                        print(f"Error processing company {company.id}: {e}")
-                        all_results[company.id] = {method: [] for method in methods}
+            future_to_company = {
+                self._finder_pool.submit(self._find_emails_resolved, company, resolved, fail_fast): company
+                for company in companies
+            }
+            
+            if fail_fast:
+                _, pending = wait(future_to_company, return_when=FIRST_EXCEPTION)
+                # Running companies can't be cancelled; they are collected below
+                cancelled = {future for future in pending if future.cancel()}
+                if cancelled:
+                    logger.warning(f"Batch stopped after a failure; {len(cancelled)} companies not processed")
+                completed = [future for future in future_to_company if future not in cancelled]
+            else:
+                completed = as_completed(future_to_company)
+            
+            for future in completed:
+                company = future_to_company[future]
+                try:
+                    results = future.result()
+                    all_results[company.id] = results
+                except Exception as e:
+                    logger.error(f"Error processing company {company.id}: {e}")
+                    # Fresh empty lists per method, never shared between companies
+                    all_results[company.id] = {method: [] for method in methods}
         else:
             # Sequential processing
             for company in companies:
-                results = self.find_emails_single(company, methods)
+                results = self._find_emails_resolved(company, resolved)
                 all_results[company.id] = results
         
         return all_results
@@ -234,15 +336,8 @@ class AddonManager:
             return checker.check_emails_batch(emails, company_ids)
         else:
             # Sequential processing
-            if company_ids is None:
-                company_ids = [None] * len(emails)
-            
-            results = []
-            for email, company_id in zip(emails, company_ids):
-                result = checker.check_email(email, company_id)
-                results.append(result)
-            
-            return results
+            ids = company_ids if company_ids is not None else repeat(None)
+            return [checker.check_email(email, company_id) for email, company_id in zip(emails, ids)]
     
     def process_companies_complete_workflow(self, companies: List[CompanyInfo], 
                                           finder_methods: List[str] = None,
@@ -274,22 +369,29 @@ class AddonManager:
         
         all_emails_to_check = []
         all_company_ids = []
+        # (company_id, normalized email) pairs already queued for checking
+        queued_for_check = set()
+        emails_to_store = defaultdict(list)
+        methods_done = []
         
         for company_id, method_results in email_results.items():
             company_total = 0
             for method, emails in method_results.items():
                 company_total += len(emails)
                 
-                # Store in database if requested
+                # Collect for storage; written once after the walk
                 if store_in_db and self.db_manager and emails:
-                    email_data = {company_id: emails}
-                    added_count = self.db_manager.add_emails_batch(email_data)
-                    self.db_manager.update_company_methods(company_id, method, completed=True)
+                    emails_to_store[company_id].extend(emails)
+                    methods_done.append((company_id, method))
                 
-                # Collect emails for checking
+                # Collect emails for checking, skipping addresses several methods found
                 if check_emails:
                     for email_result in emails:
-                        all_emails_to_check.append(email_result.email)
+                        email = email_result.email
+                        if (company_id, email) in queued_for_check:
+                            continue
+                        queued_for_check.add((company_id, email))
+                        all_emails_to_check.append(email)
                         all_company_ids.append(company_id)
             
             results['company_results'][company_id] = {
@@ -299,6 +401,11 @@ class AddonManager:
             results['total_emails_found'] += company_total
             results['companies_processed'] += 1
         
+        # Store all found emails and method tracking in one transaction each
+        if emails_to_store:
+            self.db_manager.add_emails_batch(emails_to_store)
+            self.db_manager.update_company_methods_batch(methods_done, completed=True)
+        
         # Step 2: Check emails if requested
         if check_emails and all_emails_to_check:
             print(f"Checking {len(all_emails_to_check)} emails...")
@@ -306,23 +413,26 @@ class AddonManager:
             
             # Update database with check results if available
             if store_in_db and self.db_manager:
+                # Look up all email record IDs at once instead of per checked email
+                email_ids = self.db_manager.get_email_ids_for_companies(all_company_ids)
+                checker = self.checker_addons.get('checker')
+                pending_updates = []
+                
                 for i, check_result in enumerate(check_results):
                     if 'error' not in check_result:
-                        # Find the email ID in database and update
                         email = all_emails_to_check[i]
                         company_id = all_company_ids[i]
                         
-                        # Get email record to update
-                        company_emails = self.db_manager.get_company_emails(company_id)
-                        for email_record in company_emails:
-                            if email_record['email'] == email:
-                                self.db_manager.update_email_check_results(
-                                    email_record['id'], 
-                                    check_result
-                                )
-                                break
-                        
-                        results['total_emails_checked'] += 1
+                        email_id = email_ids.get((company_id, email))
+                        if email_id is not None:
+                            # The raw API response is nested (mx, misc, smtp); the batch
+                            # update writes the flat CheckResult columns
+                            pending_updates.append((email_id, checker.process_email_data(check_result)))
+                
+                # Write all check results in one transaction
+                if pending_updates:
+                    self.db_manager.update_email_check_results_batch(pending_updates)
+                results['total_emails_checked'] += len(pending_updates)
         
         return results
 
@@ -350,19 +460,20 @@ def main():
     
     manager = AddonManager(config, args.db_path)
     
-    print(f"Available finders: {manager.get_available_finders()}")
-    print(f"Available checkers: {manager.get_available_checkers()}")
+    print(f"Available finders: {manager.get_available_finders()}\n"
+          f"Available checkers: {manager.get_available_checkers()}")
     
     if args.domain:
         # Process single domain
         company = CompanyInfo(id=0, name="Test Company", website=args.domain)
         results = manager.find_emails_single(company, args.methods)
         
-        print(f"\nResults for {args.domain}:")
+        # Build the whole report and write it in one call
+        lines = [f"\nResults for {args.domain}:"]
         for method, emails in results.items():
-            print(f"  {method}: {len(emails)} emails")
-            for email_result in emails:
-                print(f"    - {email_result.email}")
+            lines.append(f"  {method}: {len(emails)} emails")
+            lines.extend(f"    - {email_result.email}" for email_result in emails)
+        print("\n".join(lines))
     
     elif args.company_id:
         # Process single company from database
@@ -374,6 +485,8 @@ def main():
     
     else:
         print("Please specify --domain or --company-id")
+    
+    manager.close()
 
 if __name__ == "__main__":
     main()
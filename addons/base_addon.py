@@ -30,12 +30,38 @@ Base Email Addon Interface
 This module defines the standard interface that all email addons must implement.
 """
 
+import functools
+import logging
+import re
+import sys
+import threading
 from abc import ABC, abstractmethod
-from typing import List, Dict, Set, Optional, Any
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import repeat
+from typing import List, Dict, Set, NamedTuple, Optional, Any
 from dataclasses import dataclass
 from datetime import datetime
+from urllib.parse import urlparse
 
-@dataclass
+logger = logging.getLogger(__name__)
+
+# Compiled once; addresses not matching it are never sent to a checker
+EMAIL_SYNTAX_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
+# Slotted result objects (no per-instance __dict__) where dataclasses support it (3.10+)
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+@functools.lru_cache(maxsize=65536)
+def _extract_domain(website: str) -> str:
+    """Extract the lowercase domain (without www.) from a website URL."""
+    parsed = urlparse(website if website.startswith('http') else f'http://{website}')
+    domain = parsed.netloc.lower()
+    if domain.startswith('www.'):
+        domain = domain[4:]
+    return domain
+
+@dataclass(**_DATACLASS_OPTIONS)
 class EmailResult:
     """Standard result format for email operations."""
     email: str
@@ -46,12 +72,14 @@ class EmailResult:
     found_at: datetime = None
     
     def __post_init__(self):
+        # Stored normalized, so inserts and lookups can use it as is
+        self.email = self.email.lower().strip()
         if self.found_at is None:
             self.found_at = datetime.now()
         if self.metadata is None:
             self.metadata = {}
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class CompanyInfo:
     """Company information for email finding."""
     id: int
@@ -61,12 +89,22 @@ class CompanyInfo:
     
     def __post_init__(self):
         if self.domain is None and self.website:
-            # Extract domain from website
-            from urllib.parse import urlparse
-            parsed = urlparse(self.website if self.website.startswith('http') else f'http://{self.website}')
-            self.domain = parsed.netloc.lower()
-            if self.domain.startswith('www.'):
-                self.domain = self.domain[4:]
+            self.domain = _extract_domain(self.website)
+
+class CheckResult(NamedTuple):
+    """Processed email check result; fields are emails table columns, in order."""
+    is_reachable: Optional[str] = None
+    mx_accepts_mail: Optional[bool] = None
+    records: Any = None  # List of MX records (stored as JSON)
+    is_disposable: Optional[bool] = None
+    is_role_account: Optional[bool] = None
+    is_valid_syntax: Optional[bool] = None
+    can_connect_smtp: Optional[bool] = None
+    is_deliverable: Optional[bool] = None
+    is_catch_all: Optional[bool] = None
+    has_full_inbox: Optional[bool] = None
+    is_disabled: Optional[bool] = None
+    check_error: Optional[str] = None  # Error information for failed checks
 
 class BaseEmailAddon(ABC):
     """
@@ -85,6 +123,10 @@ class BaseEmailAddon(ABC):
         self.config = config or {}
         self.name = self.__class__.__name__
         self.version = "1.0.0"
+        # Worker threads for concurrent work; started on first use, kept until cleanup()
+        self._executor = None
+        self._executor_workers = None
+        self._executor_lock = threading.Lock()
     
     @abstractmethod
     def get_addon_type(self) -> str:
@@ -146,9 +188,46 @@ class BaseEmailAddon(ABC):
         """
         return True
     
+    def _get_executor(self, max_workers: int = None) -> ThreadPoolExecutor:
+        """
+        Get the addon's thread pool.
+        
+        The pool is kept between calls, so its threads (and anything they keep
+        alive, e.g. HTTP connections) are reused. Asking for a different size
+        than the current pool replaces it; tasks already submitted still finish.
+        
+        Args:
+            max_workers: Number of threads (default: config['max_workers'], or 10)
+            
+        Returns:
+            The shared ThreadPoolExecutor
+        """
+        if max_workers is None:
+            max_workers = self.config.get('max_workers', 10)
+        with self._executor_lock:
+            if self._executor is not None and self._executor_workers != max_workers:
+                self._executor.shutdown(wait=False)
+                self._executor = None
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=max_workers,
+                    thread_name_prefix=self.get_source_name()
+                )
+                self._executor_workers = max_workers
+            return self._executor
+    
     def cleanup(self):
-        """Perform any cleanup after processing."""
-        pass
+        """Perform any cleanup after processing; stops the addon's worker threads."""
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.cleanup()
 
 class EmailFinderAddon(BaseEmailAddon):
     """Base class for email finding addons."""
@@ -173,27 +252,101 @@ class EmailFinderAddon(BaseEmailAddon):
         """
         Find emails for multiple companies.
         
+        Companies run concurrently on the addon's thread pool; call cleanup()
+        to stop it.
+        
         Args:
             companies: List of company information
             
         Returns:
             Dictionary mapping company_id to list of EmailResult objects
         """
+        # Companies the addon can't handle get no emails without reaching find_emails
         results = {}
+        valid_companies = []
         for company in companies:
-            try:
-                results[company.id] = self.find_emails(company)
-            except Exception as e:
-                print(f"Error finding emails for company {company.id}: {e}")
+            if self.validate_company(company):
+                valid_companies.append(company)
+            else:
                 results[company.id] = []
+        
+        # Finders are mostly network bound, so companies are processed on the
+        # addon's pool of config['max_workers'] threads (default 10); find_emails
+        # must be thread-safe
+        if self.config.get('max_workers', 10) <= 1 or len(valid_companies) <= 1:
+            for company in valid_companies:
+                results[company.id] = self._safe_find_emails(company)
+            return results
+        
+        executor = self._get_executor()
+        future_to_company = {
+            executor.submit(self._safe_find_emails, company): company
+            for company in valid_companies
+        }
+        for future in as_completed(future_to_company):
+            results[future_to_company[future].id] = future.result()
         return results
+    
+    def _safe_find_emails(self, company: CompanyInfo) -> List[EmailResult]:
+        """Find emails for one company, turning an exception into an empty result."""
+        try:
+            return self.find_emails(company)
+        except Exception as e:
+            logger.error(f"Error finding emails for company {company.id}: {e}")
+            return []
 
 class EmailCheckerAddon(BaseEmailAddon):
     """Base class for email checking/validation addons."""
     
+    def __init__(self, config: Dict[str, Any] = None):
+        """
+        Initialize the checker with an empty per-domain result cache.
+        
+        Args:
+            config: Dictionary containing addon-specific configuration
+        """
+        super().__init__(config)
+        # Definitive domain-level results (e.g. no mail server); least recently used evicted first
+        self._domain_cache = OrderedDict()
+        self._domain_cache_size = self.config.get('domain_cache_size', 10000)
+        self._domain_cache_lock = threading.Lock()
+    
     def get_addon_type(self) -> str:
         return 'checker'
     
+    def get_cached_domain_result(self, domain: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a cached result that applies to every address at a domain.
+        
+        Args:
+            domain: Lowercase email domain
+            
+        Returns:
+            The cached result, or None if the domain has to be checked
+        """
+        with self._domain_cache_lock:
+            result = self._domain_cache.get(domain)
+            if result is not None:
+                self._domain_cache.move_to_end(domain)
+            return result
+    
+    def cache_domain_result(self, domain: str, result: Dict[str, Any]):
+        """
+        Remember a result that holds for every address at a domain.
+        
+        Only cache definitive outcomes (e.g. the domain accepts no mail), never
+        per-address or transient ones.
+        
+        Args:
+            domain: Lowercase email domain
+            result: Result to reuse for other addresses at the domain
+        """
+        with self._domain_cache_lock:
+            self._domain_cache[domain] = result
+            self._domain_cache.move_to_end(domain)
+            if len(self._domain_cache) > self._domain_cache_size:
+                self._domain_cache.popitem(last=False)
+    
     @abstractmethod
     def check_email(self, email: str, company_id: int = None) -> Dict[str, Any]:
         """
@@ -212,6 +365,12 @@ class EmailCheckerAddon(BaseEmailAddon):
         """
         Check multiple email addresses.
         
+        Addresses failing EMAIL_SYNTAX_RE get an 'invalid' result without calling
+        check_email. The rest run concurrently on the addon's pool of
+        config['max_workers'] threads (default 10), so check_email must be
+        thread-safe; results keep the input order. Call cleanup() to stop the
+        pool.
+        
         Args:
             emails: List of email addresses
             company_ids: Optional list of company IDs
@@ -220,13 +379,62 @@ class EmailCheckerAddon(BaseEmailAddon):
             List of validation result dictionaries
         """
         if company_ids is None:
-            company_ids = [None] * len(emails)
+            company_ids = repeat(None)
         
         results = []
+        to_check = []  # (position, email, company_id) of syntactically valid addresses
         for email, company_id in zip(emails, company_ids):
-            try:
-                results.append(self.check_email(email, company_id))
-            except Exception as e:
-                print(f"Error checking email {email}: {e}")
-                results.append({'email': email, 'error': str(e)})
+            if EMAIL_SYNTAX_RE.match(email):
+                to_check.append((len(results), email, company_id))
+                results.append(None)
+            else:
+                results.append(self._invalid_syntax_result(email, company_id))
+        
+        if not to_check:
+            return results
+        
+        if self.config.get('max_workers', 10) <= 1:
+            for position, email, company_id in to_check:
+                results[position] = self._safe_check_email(email, company_id)
+            return results
+        
+        # The first address of each domain is checked before the rest are submitted,
+        # so a domain-level result it caches answers them; every other check runs in parallel
+        by_domain = defaultdict(list)
+        for item in to_check:
+            by_domain[item[1].rsplit('@', 1)[1].lower()].append(item)
+        
+        # The pool outlives this call, so repeated batches reuse warm threads
+        executor = self._get_executor()
+        first_checks = {
+            executor.submit(self._safe_check_email, group[0][1], group[0][2]): group
+            for group in by_domain.values()
+        }
+        other_checks = {}
+        for future in as_completed(first_checks):
+            group = first_checks[future]
+            results[group[0][0]] = future.result()
+            for position, email, company_id in group[1:]:
+                other_checks[executor.submit(self._safe_check_email, email, company_id)] = position
+        
+        for future, position in other_checks.items():
+            results[position] = future.result()
+        
         return results
+    
+    def _invalid_syntax_result(self, email: str, company_id: int = None) -> Dict[str, Any]:
+        """Result for an address rejected by the syntax pre-check."""
+        return {
+            'email': email,
+            'company_id': company_id,
+            'is_reachable': 'invalid',
+            'syntax': {'is_valid_syntax': False}
+        }
+    
+    def _safe_check_email(self, email: str, company_id: int = None) -> Dict[str, Any]:
+        """Check one email, turning an exception into an error result."""
+        try:
+            return self.check_email(email, company_id)
+        except Exception as e:
+            logger.error(f"Error checking email {email}: {e}")
+            return {'email': email, 'error': str(e)}
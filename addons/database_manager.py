@@ -31,35 +31,239 @@ Handles all database operations for the new emails table and company tracking.
 """
 
 import sqlite3
+import functools
 import json
+import logging
 import sys
 import os
-from typing import List, Dict, Any
-from datetime import datetime
+import queue
+import threading
+from contextlib import contextmanager
+from typing import List, Dict, Any, Iterator, Tuple, Union
+from datetime import datetime, timedelta
 
 # Add current directory to path for imports
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-from base_addon import EmailResult, CompanyInfo
+from base_addon import EmailResult, CompanyInfo, CheckResult
+
+logger = logging.getLogger(__name__)
+
+# orjson is optional; it encodes metadata and MX record lists several times faster
+try:
+    import orjson
+    
+    def _json_dumps(value: Any) -> str:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+except ImportError:
+    # Same compact output as orjson: no spaces after separators
+    _json_dumps = functools.partial(json.dumps, separators=(',', ':'))
+
+# Applied once when the shared connection is opened
+CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",
+)
+READ_CONNECTION_PRAGMAS = (
+    "PRAGMA query_only=1",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",
+)
+
+# Check result keys stored on the emails table (key name == column name)
+CHECK_RESULT_FIELDS = CheckResult._fields
+
+def _adapt_metadata(metadata: dict) -> Any:
+    """Store email metadata as JSON, empty metadata as NULL."""
+    return _json_dumps(metadata) if metadata else None
+
+# Shared by add_email and add_emails_batch
+INSERT_EMAIL_SQL = """
+    INSERT OR IGNORE INTO emails 
+    (company_id, email, source, source_details, confidence, metadata, created_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Records a completed finder method in the company_methods table
+INSERT_COMPANY_METHOD_SQL = """
+    INSERT OR REPLACE INTO company_methods (company_id, method, completed_at)
+    VALUES (?, ?, ?)
+"""
+
+def _email_row(company_id: int, email_result: EmailResult) -> tuple:
+    """Build the INSERT_EMAIL_SQL parameters for one found email."""
+    return (
+        company_id,
+        email_result.email,  # normalized by EmailResult
+        email_result.source,
+        email_result.source_details,
+        email_result.confidence,
+        _adapt_metadata(email_result.metadata),
+        email_result.found_at
+    )
+
+# Writes all CHECK_RESULT_FIELDS, then checked_at, for one email id
+UPDATE_CHECK_RESULTS_SQL = f"""
+    UPDATE emails 
+    SET {', '.join(f'{field} = ?' for field in CHECK_RESULT_FIELDS)}, checked_at = ?
+    WHERE id = ?
+"""
+
+@functools.lru_cache(maxsize=None)
+def _partial_check_results_sql(fields: Tuple[str, ...]) -> str:
+    """UPDATE for only the given check result fields plus checked_at (one per field set)."""
+    return f"""
+        UPDATE emails 
+        SET {', '.join(f'{field} = ?' for field in fields + ('checked_at',))}
+        WHERE id = ?
+    """
+
+def _check_result_value(field: str, value: Any) -> Any:
+    """Convert a check result value for storage."""
+    # Convert records to JSON string if it's a list
+    if field == 'records' and isinstance(value, list):
+        return _json_dumps(value)
+    return value
+
+def _check_result_params(result) -> tuple:
+    """Build the CHECK_RESULT_FIELDS parameters from a CheckResult or result dict."""
+    if isinstance(result, CheckResult):
+        if isinstance(result.records, list):
+            return result._replace(records=_json_dumps(result.records))
+        return result
+    return tuple(_check_result_value(field, result.get(field)) for field in CHECK_RESULT_FIELDS)
+
+class SQLitePool:
+    """
+    One read-write connection plus a small pool of read-only connections.
+    
+    With WAL journaling readers don't block the writer (or each other), so
+    SELECT-only queries can run in parallel with a write transaction. The
+    write connection is shared and serialized by a lock; read connections
+    are handed out from a queue and opened on demand up to max_readers.
+    """
+    
+    def __init__(self, db_path: str, max_readers: int = 4):
+        """
+        Args:
+            db_path: Path to the SQLite database file
+            max_readers: Maximum number of read-only connections
+        """
+        self.db_path = db_path
+        self.max_readers = max_readers
+        self._write_conn = None
+        self._write_lock = threading.RLock()
+        self._readers = queue.Queue()
+        self._reader_count = 0
+        self._reader_lock = threading.Lock()
+    
+    def _open(self, readonly: bool = False) -> sqlite3.Connection:
+        """Open and configure a new connection."""
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn.row_factory = sqlite3.Row  # Enable column access by name
+        for pragma in (READ_CONNECTION_PRAGMAS if readonly else CONNECTION_PRAGMAS):
+            conn.execute(pragma)
+        return conn
+    
+    def _get_write_conn(self) -> sqlite3.Connection:
+        """Open the shared write connection on first use."""
+        with self._write_lock:
+            if self._write_conn is None:
+                self._write_conn = self._open()
+            return self._write_conn
+    
+    @contextmanager
+    def writer(self) -> Iterator[sqlite3.Connection]:
+        """
+        Use the write connection exclusively for the duration of the with block.
+        
+        The transaction is committed on success and rolled back on error.
+        """
+        with self._write_lock:
+            conn = self._get_write_conn()
+            try:
+                yield conn
+                conn.commit()
+            except BaseException:
+                conn.rollback()
+                raise
+    
+    @contextmanager
+    def reader(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a read-only connection for the duration of the with block."""
+        try:
+            conn = self._readers.get_nowait()
+        except queue.Empty:
+            with self._reader_lock:
+                can_open = self._reader_count < self.max_readers
+                if can_open:
+                    self._reader_count += 1
+            if can_open:
+                # The writer switches the database file to WAL first
+                self._get_write_conn()
+                try:
+                    conn = self._open(readonly=True)
+                except sqlite3.Error:
+                    with self._reader_lock:
+                        self._reader_count -= 1
+                    raise
+            else:
+                conn = self._readers.get()
+        
+        try:
+            yield conn
+        finally:
+            self._readers.put(conn)
+    
+    def close(self):
+        """Close the write connection and all idle read connections."""
+        with self._write_lock:
+            if self._write_conn is not None:
+                self._write_conn.close()
+                self._write_conn = None
+        with self._reader_lock:
+            while True:
+                try:
+                    self._readers.get_nowait().close()
+                except queue.Empty:
+                    break
+                self._reader_count -= 1
 
 class EmailDatabaseManager:
     """Manages database operations for the new email architecture."""
     
-    def __init__(self, db_path: str, id_column: str = "id"):
+    def __init__(self, db_path: str, id_column: str = "id", max_readers: int = 4,
+                 table_name: str = "companies"):
         """
         Initialize database manager.
         
         Args:
             db_path: Path to the SQLite database file
             id_column: Name of the ID column in the companies table
+            max_readers: Maximum number of concurrent read-only connections
+            table_name: Name of the companies table
         """
         self.db_path = db_path
         self.id_column = id_column
+        self.table_name = table_name
+        # Long-lived connections shared by all calls (and threads)
+        self._pool = SQLitePool(db_path, max_readers)
+        self._company_methods_ready = False
     
-    def get_connection(self) -> sqlite3.Connection:
-        """Get a database connection."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row  # Enable column access by name
-        return conn
+    def get_connection(self, readonly: bool = False):
+        """
+        Use a pooled database connection in a with block.
+        
+        Args:
+            readonly: Borrow one of the read-only connections (SELECT only)
+                instead of the shared write connection
+        """
+        return self._pool.reader() if readonly else self._pool.writer()
+    
+    def close(self):
+        """Close all database connections."""
+        self._pool.close()
     
     def ensure_emails_table(self) -> bool:
         """
@@ -96,6 +300,8 @@ class EmailDatabaseManager:
                         is_disabled BOOLEAN,
                         check_error TEXT,  -- Store error information for failed checks
                         checked_at TIMESTAMP,
+                        claim_id TEXT,  -- Checker run currently holding the row
+                        claimed_at TIMESTAMP,
 
                         FOREIGN KEY (company_id) REFERENCES companies (id),
                         UNIQUE(company_id, email)
@@ -106,21 +312,73 @@ class EmailDatabaseManager:
                 cursor.execute("CREATE INDEX IF NOT EXISTS idx_emails_company_id ON emails (company_id)")
                 cursor.execute("CREATE INDEX IF NOT EXISTS idx_emails_source ON emails (source)")
                 cursor.execute("CREATE INDEX IF NOT EXISTS idx_emails_email ON emails (email)")
-                cursor.execute("CREATE INDEX IF NOT EXISTS idx_emails_checked_at ON emails (checked_at)")
+                # Indexes for get_unchecked_emails (oldest first, optionally per source).
+                # Without sqlite_stat1 the planner never picks a partial index on
+                # created_at alone over an index leading with checked_at and sorts every
+                # unchecked row first, so the unfiltered case leads with checked_at instead
+                cursor.execute("""
+                    CREATE INDEX IF NOT EXISTS idx_emails_unchecked
+                    ON emails (source, created_at) WHERE checked_at IS NULL
+                """)
+                cursor.execute("""
+                    CREATE INDEX IF NOT EXISTS idx_emails_checked_created
+                    ON emails (checked_at, created_at)
+                """)
+                # Replaced by idx_emails_checked_created, which leads with the same column
+                cursor.execute("DROP INDEX IF EXISTS idx_emails_checked_at")
 
-                # Ensure check_error column exists for existing databases
+                # Ensure newer columns exist for existing databases
                 cursor.execute("PRAGMA table_info(emails)")
                 columns = [row[1] for row in cursor.fetchall()]
-                if 'check_error' not in columns:
-                    print("Adding missing check_error column to emails table")
-                    cursor.execute("ALTER TABLE emails ADD COLUMN check_error TEXT")
+                for column, column_type in (('check_error', 'TEXT'), ('claim_id', 'TEXT'), ('claimed_at', 'TIMESTAMP')):
+                    if column not in columns:
+                        logger.info(f"Adding missing {column} column to emails table")
+                        cursor.execute(f"ALTER TABLE emails ADD COLUMN {column} {column_type}")
 
                 conn.commit()
-                return True
+
+            self._ensure_company_methods_table()
+            return True
         except sqlite3.Error as e:
-            print(f"Error creating emails table: {e}")
+            logger.error(f"Error creating emails table: {e}")
             return False
 
+    def _ensure_company_methods_table(self):
+        """
+        Create the company_methods table (completed finder methods per company).
+        
+        On creation it is backfilled once from the companies.email_methods_completed
+        JSON column, which is still kept up to date for existing readers. Checked
+        once per manager, so methods using the table can call this first.
+        """
+        if self._company_methods_ready:
+            return
+        
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'company_methods'")
+            if not cursor.fetchone():
+                cursor.execute("""
+                    CREATE TABLE company_methods (
+                        company_id INTEGER NOT NULL,
+                        method TEXT NOT NULL,
+                        completed_at TIMESTAMP,
+                        PRIMARY KEY (company_id, method)
+                    )
+                """)
+                
+                cursor.execute(f"PRAGMA table_info({self.table_name})")
+                columns = [row[1] for row in cursor.fetchall()]
+                if 'email_methods_completed' in columns:
+                    cursor.execute(f"""
+                        INSERT OR IGNORE INTO company_methods (company_id, method, completed_at)
+                        SELECT c.{self.id_column}, m.value, c.last_email_scan
+                        FROM {self.table_name} c, json_each(c.email_methods_completed) m
+                        WHERE json_valid(c.email_methods_completed)
+                    """)
+        
+        self._company_methods_ready = True
+    
     def ensure_companies_table_columns(self) -> bool:
         """
         Ensure the companies table has all required columns for email tracking.
@@ -133,7 +391,7 @@ class EmailDatabaseManager:
                 cursor = conn.cursor()
 
                 # Get current table schema
-                cursor.execute("PRAGMA table_info(companies)")
+                cursor.execute(f"PRAGMA table_info({self.table_name})")
                 columns = [row[1] for row in cursor.fetchall()]
 
                 # Add missing columns
@@ -145,13 +403,13 @@ class EmailDatabaseManager:
 
                 for column_name, column_type in required_columns.items():
                     if column_name not in columns:
-                        print(f"Adding missing column: {column_name}")
-                        cursor.execute(f"ALTER TABLE companies ADD COLUMN {column_name} {column_type}")
+                        logger.info(f"Adding missing column: {column_name}")
+                        cursor.execute(f"ALTER TABLE {self.table_name} ADD COLUMN {column_name} {column_type}")
 
                 conn.commit()
                 return True
         except sqlite3.Error as e:
-            print(f"Error ensuring companies table columns: {e}")
+            logger.error(f"Error ensuring companies table columns: {e}")
             return False
     
     def add_email(self, company_id: int, email_result: EmailResult) -> bool:
@@ -168,64 +426,50 @@ class EmailDatabaseManager:
         try:
             with self.get_connection() as conn:
                 cursor = conn.cursor()
-                cursor.execute("""
-                    INSERT OR IGNORE INTO emails 
-                    (company_id, email, source, source_details, confidence, metadata, created_at)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    company_id,
-                    email_result.email.lower().strip(),
-                    email_result.source,
-                    email_result.source_details,
-                    email_result.confidence,
-                    json.dumps(email_result.metadata) if email_result.metadata else None,
-                    email_result.found_at
-                ))
+                cursor.execute(INSERT_EMAIL_SQL, _email_row(company_id, email_result))
                 conn.commit()
                 return cursor.rowcount > 0
         except sqlite3.Error as e:
-            print(f"Error adding email {email_result.email}: {e}")
+            logger.error(f"Error adding email {email_result.email}: {e}")
             return False
     
-    def add_emails_batch(self, emails_data: Dict[int, List[EmailResult]]) -> int:
+    def add_emails_batch(self, emails_data: Dict[int, List[EmailResult]], raise_on_error: bool = False) -> int:
         """
         Add multiple emails to the database in batch.
         
         Args:
             emails_data: Dictionary mapping company_id to list of EmailResult objects
+            raise_on_error: Re-raise a failed insert (after rollback) instead of
+                logging it and returning 0, which also means "all duplicates"
             
         Returns:
             Number of emails successfully added
         """
+        # Same values as _email_row, inlined to skip a function call per row
+        rows = [
+            (company_id, result.email, result.source, result.source_details,
+             result.confidence, _adapt_metadata(result.metadata), result.found_at)
+            for company_id, email_results in emails_data.items()
+            for result in email_results
+        ]
+        if not rows:
+            return 0
+        
         added_count = 0
         try:
             with self.get_connection() as conn:
-                cursor = conn.cursor()
-                
-                for company_id, email_results in emails_data.items():
-                    for email_result in email_results:
-                        try:
-                            cursor.execute("""
-                                INSERT OR IGNORE INTO emails 
-                                (company_id, email, source, source_details, confidence, metadata, created_at)
-                                VALUES (?, ?, ?, ?, ?, ?, ?)
-                            """, (
-                                company_id,
-                                email_result.email.lower().strip(),
-                                email_result.source,
-                                email_result.source_details,
-                                email_result.confidence,
-                                json.dumps(email_result.metadata) if email_result.metadata else None,
-                                email_result.found_at
-                            ))
-                            if cursor.rowcount > 0:
-                                added_count += 1
-                        except sqlite3.Error as e:
-                            print(f"Error adding email {email_result.email} for company {company_id}: {e}")
-                
+                # One write transaction and one executemany for the whole batch
+                conn.execute("BEGIN IMMEDIATE")
+                changes_before = conn.total_changes
+                conn.executemany(INSERT_EMAIL_SQL, rows)
+                # Ignored duplicates don't count as changes
+                added_count = conn.total_changes - changes_before
                 conn.commit()
         except sqlite3.Error as e:
-            print(f"Error in batch email insert: {e}")
+            if raise_on_error:
+                raise
+            logger.error(f"Error in batch email insert: {e}")
+            added_count = 0  # the transaction was rolled back
         
         return added_count
     
@@ -240,8 +484,23 @@ class EmailDatabaseManager:
         Returns:
             List of email dictionaries
         """
+        return list(self.iter_company_emails(company_id, source))
+    
+    def iter_company_emails(self, company_id: int, source: str = None) -> Iterator[Dict[str, Any]]:
+        """
+        Stream the emails of a company row by row.
+        
+        A read connection stays borrowed until the iterator is exhausted or closed.
+        
+        Args:
+            company_id: ID of the company
+            source: Optional filter by source
+            
+        Yields:
+            Email dictionaries
+        """
         try:
-            with self.get_connection() as conn:
+            with self.get_connection(readonly=True) as conn:
                 cursor = conn.cursor()
                 
                 if source:
@@ -257,10 +516,44 @@ class EmailDatabaseManager:
                         ORDER BY created_at DESC
                     """, (company_id,))
                 
-                return [dict(row) for row in cursor.fetchall()]
+                try:
+                    for row in cursor:
+                        yield dict(row)
+                finally:
+                    cursor.close()
         except sqlite3.Error as e:
-            print(f"Error getting emails for company {company_id}: {e}")
-            return []
+            logger.error(f"Error getting emails for company {company_id}: {e}")
+    
+    def get_email_ids_for_companies(self, company_ids: List[int]) -> Dict[tuple, int]:
+        """
+        Get email record IDs for several companies in one query per chunk.
+        
+        Args:
+            company_ids: IDs of the companies
+            
+        Returns:
+            Dictionary mapping (company_id, email) to email record ID
+        """
+        email_ids = {}
+        company_ids = list(dict.fromkeys(company_ids))
+        try:
+            with self.get_connection(readonly=True) as conn:
+                cursor = conn.cursor()
+                
+                # Stay well below SQLite's bound-parameter limit
+                for i in range(0, len(company_ids), 500):
+                    chunk = company_ids[i:i + 500]
+                    placeholders = ', '.join('?' * len(chunk))
+                    cursor.execute(f"""
+                        SELECT id, company_id, email FROM emails
+                        WHERE company_id IN ({placeholders})
+                    """, chunk)
+                    for email_id, company_id, email in cursor.fetchall():
+                        email_ids[(company_id, email)] = email_id
+        except sqlite3.Error as e:
+            logger.error(f"Error getting email IDs for companies: {e}")
+        
+        return email_ids
     
     def get_unchecked_emails(self, limit: int = None, source: str = None) -> List[Dict[str, Any]]:
         """
@@ -273,8 +566,23 @@ class EmailDatabaseManager:
         Returns:
             List of email dictionaries
         """
+        return list(self.iter_unchecked_emails(limit, source))
+    
+    def iter_unchecked_emails(self, limit: int = None, source: str = None) -> Iterator[Dict[str, Any]]:
+        """
+        Stream emails that haven't been checked yet, oldest first.
+        
+        A read connection stays borrowed until the iterator is exhausted or closed.
+        
+        Args:
+            limit: Maximum number of emails to return
+            source: Optional filter by source
+            
+        Yields:
+            Email dictionaries
+        """
         try:
-            with self.get_connection() as conn:
+            with self.get_connection(readonly=True) as conn:
                 cursor = conn.cursor()
                 
                 query = """
@@ -294,10 +602,109 @@ class EmailDatabaseManager:
                     params.append(limit)
                 
                 cursor.execute(query, params)
-                return [dict(row) for row in cursor.fetchall()]
+                try:
+                    for row in cursor:
+                        yield dict(row)
+                finally:
+                    cursor.close()
+        except sqlite3.Error as e:
+            logger.error(f"Error getting unchecked emails: {e}")
+    
+    def count_unchecked_emails(self, source: str = None) -> int:
+        """
+        Count emails that haven't been checked yet.
+        
+        Args:
+            source: Optional filter by source
+            
+        Returns:
+            Number of unchecked emails
+        """
+        try:
+            with self.get_connection(readonly=True) as conn:
+                query = "SELECT COUNT(*) FROM emails WHERE checked_at IS NULL"
+                params = []
+                
+                if source:
+                    query += " AND source = ?"
+                    params.append(source)
+                
+                return conn.execute(query, params).fetchone()[0]
         except sqlite3.Error as e:
-            print(f"Error getting unchecked emails: {e}")
+            logger.error(f"Error counting unchecked emails: {e}")
+            return 0
+    
+    def claim_unchecked_emails(self, claim_id: str, limit: int, source: str = None,
+                               ttl: int = 600) -> List[Dict[str, Any]]:
+        """
+        Claim the oldest unchecked emails for one checker run.
+        
+        Rows claimed by another run are skipped until their claim is older than
+        `ttl` seconds, so several checker processes can share a database without
+        paying for the same API calls, and rows held by a crashed run are picked
+        up again later. Selecting and claiming happen in one write transaction.
+        
+        Args:
+            claim_id: Identifier of the claiming run
+            limit: Maximum number of emails to claim
+            source: Optional filter by source
+            ttl: Seconds after which another run's claim may be taken over; must
+                exceed how long a run may hold its rows before checking them
+            
+        Returns:
+            Claimed email dictionaries (empty when none are left or on error)
+        """
+        now = datetime.now()
+        query = """
+            SELECT * FROM emails
+            WHERE checked_at IS NULL AND (claimed_at IS NULL OR claimed_at < ?)
+        """
+        params = [now - timedelta(seconds=ttl)]
+        
+        if source:
+            query += " AND source = ?"
+            params.append(source)
+        
+        query += " ORDER BY created_at ASC LIMIT ?"
+        params.append(limit)
+        
+        try:
+            with self.get_connection() as conn:
+                # Hold the write lock from the SELECT on, so no other process claims the same rows
+                conn.execute("BEGIN IMMEDIATE")
+                emails = [dict(row) for row in conn.execute(query, params)]
+                conn.executemany(
+                    "UPDATE emails SET claim_id = ?, claimed_at = ? WHERE id = ?",
+                    [(claim_id, now, email['id']) for email in emails]
+                )
+                conn.commit()
+        except sqlite3.Error as e:
+            logger.error(f"Error claiming unchecked emails: {e}")
             return []
+        
+        return emails
+    
+    def release_email_claims(self, claim_id: str) -> int:
+        """
+        Release the emails a run claimed but did not check.
+        
+        Args:
+            claim_id: Identifier used with claim_unchecked_emails
+            
+        Returns:
+            Number of emails released
+        """
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.execute(
+                    "UPDATE emails SET claim_id = NULL, claimed_at = NULL WHERE claim_id = ? AND checked_at IS NULL",
+                    (claim_id,)
+                )
+                conn.commit()
+                return cursor.rowcount
+        except sqlite3.Error as e:
+            logger.error(f"Error releasing email claims: {e}")
+            return 0
     
     def update_email_check_results(self, email_id: int, check_results: Dict[str, Any]) -> bool:
         """
@@ -310,60 +717,62 @@ class EmailDatabaseManager:
         Returns:
             True if successful, False otherwise
         """
+        # Only the result keys given are written; the statement text is built once
+        # per distinct key set, so sqlite3's statement cache reuses the prepared plan
+        fields = tuple(field for field in CHECK_RESULT_FIELDS if field in check_results)
+        params = [_check_result_value(field, check_results[field]) for field in fields]
+        # Always update checked_at
+        params.append(datetime.now())
+        params.append(email_id)
+        
         try:
             with self.get_connection() as conn:
-                cursor = conn.cursor()
-                
-                # Map check results to database columns
-                update_fields = []
-                params = []
-                
-                field_mapping = {
-                    'is_reachable': 'is_reachable',
-                    'mx_accepts_mail': 'mx_accepts_mail',
-                    'records': 'records',
-                    'is_disposable': 'is_disposable',
-                    'is_role_account': 'is_role_account',
-                    'is_valid_syntax': 'is_valid_syntax',
-                    'can_connect_smtp': 'can_connect_smtp',
-                    'is_deliverable': 'is_deliverable',
-                    'is_catch_all': 'is_catch_all',
-                    'has_full_inbox': 'has_full_inbox',
-                    'is_disabled': 'is_disabled',
-                    'check_error': 'check_error'  # Store error information
-                }
-                
-                for result_key, db_column in field_mapping.items():
-                    if result_key in check_results:
-                        update_fields.append(f"{db_column} = ?")
-                        value = check_results[result_key]
-                        # Convert records to JSON string if it's a list
-                        if result_key == 'records' and isinstance(value, list):
-                            value = json.dumps(value)
-                        params.append(value)
-                
-                # Always update checked_at
-                update_fields.append("checked_at = ?")
-                params.append(datetime.now())
-                
-                # Add email_id for WHERE clause
-                params.append(email_id)
-                
-                if update_fields:
-                    query = f"""
-                        UPDATE emails 
-                        SET {', '.join(update_fields)}
-                        WHERE id = ?
-                    """
-                    cursor.execute(query, params)
-                    conn.commit()
-                    return cursor.rowcount > 0
-                
+                cursor = conn.execute(_partial_check_results_sql(fields), params)
+                conn.commit()
+                return cursor.rowcount > 0
         except sqlite3.Error as e:
-            print(f"Error updating email check results for ID {email_id}: {e}")
+            logger.error(f"Error updating email check results for ID {email_id}: {e}")
             return False
+    
+    def update_email_check_results_batch(self, check_results: List[Tuple[int, Union[CheckResult, Dict[str, Any]]]]) -> int:
+        """
+        Update several emails with validation results in a single transaction.
+        
+        Every row is written with the same UPDATE_CHECK_RESULTS_SQL statement
+        through one executemany; result keys that are missing are stored as NULL,
+        so a new check fully replaces the previous one (including check_error).
+        CheckResult tuples are bound as they are, without a per-field lookup.
+        
+        Args:
+            check_results: List of (email_id, CheckResult or result dict) tuples
+            
+        Returns:
+            Number of email records updated
+        """
+        if not check_results:
+            return 0
         
-        return False
+        checked_at = datetime.now()
+        rows = [
+            (*_check_result_params(result), checked_at, email_id)
+            for email_id, result in check_results
+        ]
+        
+        try:
+            with self.get_connection() as conn:
+                if len(rows) == 1:
+                    # One statement is its own transaction; no need for executemany
+                    cursor = conn.execute(UPDATE_CHECK_RESULTS_SQL, rows[0])
+                else:
+                    conn.execute("BEGIN IMMEDIATE")
+                    cursor = conn.executemany(UPDATE_CHECK_RESULTS_SQL, rows)
+                updated_count = cursor.rowcount
+                conn.commit()
+        except sqlite3.Error as e:
+            logger.error(f"Error updating email check results in batch: {e}")
+            return 0
+        
+        return updated_count
     
     def update_company_methods(self, company_id: int, method: str, completed: bool = True) -> bool:
         """
@@ -378,13 +787,14 @@ class EmailDatabaseManager:
             True if successful, False otherwise
         """
         try:
+            self._ensure_company_methods_table()
             with self.get_connection() as conn:
                 cursor = conn.cursor()
                 
                 # Get current methods
                 cursor.execute(f"""
                     SELECT email_methods_used, email_methods_completed 
-                    FROM companies WHERE {self.id_column} = ?
+                    FROM {self.table_name} WHERE {self.id_column} = ?
                 """, (company_id,))
                 
                 row = cursor.fetchone()
@@ -405,7 +815,7 @@ class EmailDatabaseManager:
                 
                 # Update database
                 cursor.execute(f"""
-                    UPDATE companies 
+                    UPDATE {self.table_name} 
                     SET email_methods_used = ?, 
                         email_methods_completed = ?,
                         last_email_scan = ?
@@ -416,14 +826,90 @@ class EmailDatabaseManager:
                     datetime.now(),
                     company_id
                 ))
+                updated = cursor.rowcount > 0
+                
+                if completed:
+                    cursor.execute(INSERT_COMPANY_METHOD_SQL, (company_id, method, datetime.now()))
                 
                 conn.commit()
-                return cursor.rowcount > 0
+                return updated
                 
         except sqlite3.Error as e:
-            print(f"Error updating company methods for ID {company_id}: {e}")
+            logger.error(f"Error updating company methods for ID {company_id}: {e}")
             return False
     
+    def update_company_methods_batch(self, company_methods: List[Tuple[int, str]], completed: bool = True) -> int:
+        """
+        Update method tracking for several companies in one transaction.
+        
+        Args:
+            company_methods: List of (company_id, method) pairs
+            completed: Whether the methods completed successfully
+            
+        Returns:
+            Number of companies updated
+        """
+        methods_by_company = {}
+        for company_id, method in company_methods:
+            methods = methods_by_company.setdefault(company_id, [])
+            if method not in methods:
+                methods.append(method)
+        
+        if not methods_by_company:
+            return 0
+        
+        company_ids = list(methods_by_company)
+        try:
+            self._ensure_company_methods_table()
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                
+                # Read the current method lists in chunks below SQLite's parameter limit
+                current = {}
+                for i in range(0, len(company_ids), 500):
+                    chunk = company_ids[i:i + 500]
+                    placeholders = ', '.join('?' * len(chunk))
+                    cursor.execute(f"""
+                        SELECT {self.id_column}, email_methods_used, email_methods_completed
+                        FROM {self.table_name} WHERE {self.id_column} IN ({placeholders})
+                    """, chunk)
+                    for company_id, used, done in cursor.fetchall():
+                        current[company_id] = (
+                            json.loads(used) if used else [],
+                            json.loads(done) if done else []
+                        )
+                
+                now = datetime.now()
+                rows = []
+                method_rows = []
+                for company_id, (used_methods, completed_methods) in current.items():
+                    for method in methods_by_company[company_id]:
+                        if method not in used_methods:
+                            used_methods.append(method)
+                        if completed and method not in completed_methods:
+                            completed_methods.append(method)
+                        if completed:
+                            method_rows.append((company_id, method, now))
+                    rows.append((json.dumps(used_methods), json.dumps(completed_methods), now, company_id))
+                
+                cursor.executemany(f"""
+                    UPDATE {self.table_name} 
+                    SET email_methods_used = ?, 
+                        email_methods_completed = ?,
+                        last_email_scan = ?
+                    WHERE {self.id_column} = ?
+                """, rows)
+                updated = cursor.rowcount
+                
+                cursor.executemany(INSERT_COMPANY_METHOD_SQL, method_rows)
+                
+                conn.commit()
+                return updated
+                
+        except sqlite3.Error as e:
+            logger.error(f"Error updating company methods in batch: {e}")
+            return 0
+    
     def get_companies_needing_method(self, method: str, limit: int = None) -> List[CompanyInfo]:
         """
         Get companies that haven't had a specific email finding method applied.
@@ -436,23 +922,24 @@ class EmailDatabaseManager:
             List of CompanyInfo objects
         """
         try:
-            with self.get_connection() as conn:
+            self._ensure_company_methods_table()
+            with self.get_connection(readonly=True) as conn:
                 cursor = conn.cursor()
                 
-                query = """
-                    SELECT id, name, website 
-                    FROM companies 
-                    WHERE website IS NOT NULL 
-                    AND website != ''
-                    AND (
-                        email_methods_completed IS NULL 
-                        OR email_methods_completed = '[]'
-                        OR json_extract(email_methods_completed, '$') NOT LIKE ?
-                    )
-                    ORDER BY id ASC
+                # Anti-join on the company_methods primary key instead of
+                # scanning the JSON column of every company
+                query = f"""
+                    SELECT c.{self.id_column}, c.name, c.website 
+                    FROM {self.table_name} c
+                    LEFT JOIN company_methods cm 
+                        ON cm.company_id = c.{self.id_column} AND cm.method = ?
+                    WHERE c.website IS NOT NULL 
+                    AND c.website != ''
+                    AND cm.company_id IS NULL
+                    ORDER BY c.{self.id_column} ASC
                 """
                 
-                params = [f'%"{method}"%']
+                params = [method]
                 
                 if limit:
                     query += " LIMIT ?"
@@ -471,7 +958,7 @@ class EmailDatabaseManager:
                 return companies
                 
         except sqlite3.Error as e:
-            print(f"Error getting companies needing method {method}: {e}")
+            logger.error(f"Error getting companies needing method {method}: {e}")
             return []
     
     def get_email_stats(self) -> Dict[str, Any]:
@@ -482,34 +969,27 @@ class EmailDatabaseManager:
             Dictionary with email statistics
         """
         try:
-            with self.get_connection() as conn:
+            with self.get_connection(readonly=True) as conn:
                 cursor = conn.cursor()
                 
-                stats = {}
-                
-                # Total emails
-                cursor.execute("SELECT COUNT(*) FROM emails")
-                stats['total_emails'] = cursor.fetchone()[0]
-                
-                # Emails by source
+                # Per-source totals and checked counts in one pass; the distinct
+                # company count is an uncorrelated subquery evaluated once
                 cursor.execute("""
-                    SELECT source, COUNT(*) 
+                    SELECT source, COUNT(*), COUNT(checked_at),
+                           (SELECT COUNT(DISTINCT company_id) FROM emails)
                     FROM emails 
                     GROUP BY source
                 """)
-                stats['by_source'] = dict(cursor.fetchall())
+                rows = cursor.fetchall()
                 
-                # Checked vs unchecked
-                cursor.execute("SELECT COUNT(*) FROM emails WHERE checked_at IS NOT NULL")
-                stats['checked_emails'] = cursor.fetchone()[0]
+                stats = {'by_source': {row[0]: row[1] for row in rows}}
+                stats['total_emails'] = sum(stats['by_source'].values())
+                stats['checked_emails'] = sum(row[2] for row in rows)
                 stats['unchecked_emails'] = stats['total_emails'] - stats['checked_emails']
-                
-                # Companies with emails
-                cursor.execute("SELECT COUNT(DISTINCT company_id) FROM emails")
-                stats['companies_with_emails'] = cursor.fetchone()[0]
+                stats['companies_with_emails'] = rows[0][3] if rows else 0
                 
                 return stats
                 
         except sqlite3.Error as e:
-            print(f"Error getting email stats: {e}")
+            logger.error(f"Error getting email stats: {e}")
             return {}
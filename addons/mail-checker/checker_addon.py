@@ -33,22 +33,183 @@ Adapted from the original mail-checker/check.py to work with the new emails tabl
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from collections import Counter, deque
+import functools
+import importlib.util
+import math
+import queue
+import statistics
 import sys
 import os
+import threading
 import time
-from typing import List, Dict, Any
+import uuid
+from typing import List, Dict, Any, Iterator
+from urllib.parse import urlparse
 
-# Add parent directory to path for imports
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Resolved once at import: addons/mail-checker, addons and the geo_mail root
+_HERE = os.path.dirname(os.path.abspath(__file__))
+_ADDONS_DIR = os.path.dirname(_HERE)
+_GEO_MAIL_ROOT = os.path.dirname(_ADDONS_DIR)
 
-from base_addon import EmailCheckerAddon
+# Add parent directory to path for imports (once, even if loaded under several names)
+if _ADDONS_DIR not in sys.path:
+    sys.path.append(_ADDONS_DIR)
+
+from base_addon import EMAIL_SYNTAX_RE, CheckResult, EmailCheckerAddon
 from addon_logger import setup_addon_logging
 
 # Set up logging for this addon
 logger = setup_addon_logging("mail-checker")
 
+# orjson is optional; it encodes requests and decodes API responses several times faster
+try:
+    from orjson import dumps as _json_dumps, loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(value: Any) -> bytes:
+        return json.dumps(value, separators=(',', ':')).encode()
+
+@functools.lru_cache(maxsize=1)
+def _load_db_manager():
+    """
+    Load EmailDatabaseManager from addons/database_manager.py once per process.
+    
+    Loaded by file path because modules/database_manager.py may shadow the
+    module name on sys.path.
+    """
+    db_manager_path = os.path.join(_ADDONS_DIR, 'database_manager.py')
+    spec = importlib.util.spec_from_file_location("database_manager", db_manager_path)
+    database_manager_module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(database_manager_module)
+    return database_manager_module.EmailDatabaseManager
+
+# Sent with every check request
+API_HEADERS = {"Content-Type": "application/json"}
+
+# API hosts that never go through a proxy
+LOCAL_HOSTS = frozenset({'localhost', '127.0.0.1', '::1'})
+
+# Seconds added to a claim's lifetime on top of the time its checks may take
+CLAIM_TTL_MARGIN = 600
+
+# Stand-in for response sections the API left out (never mutated)
+_EMPTY: Dict[str, Any] = {}
+
+def _read_ahead(rows: Iterator, size: int) -> Iterator:
+    """
+    Yield from an iterator while a background thread reads up to `size` items ahead.
+
+    Used for database rows, so the next ones are already fetched while the
+    current ones are being checked. Closing the returned generator stops the
+    reader thread and closes `rows` on it.
+
+    Args:
+        rows: Iterator to read from (closed when done if it has close())
+        size: Maximum number of items read ahead
+
+    Yields:
+        Items of `rows`, in order
+    """
+    buffer = queue.Queue(maxsize=size)
+    stop = threading.Event()
+    finished = object()
+    errors = []
+
+    def put(item) -> bool:
+        # Give up once the consumer has gone away instead of blocking forever
+        while not stop.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def reader():
+        try:
+            for row in rows:
+                if not put(row):
+                    return
+        except Exception as e:
+            errors.append(e)
+        finally:
+            if hasattr(rows, 'close'):
+                rows.close()
+        put(finished)
+
+    thread = threading.Thread(target=reader, name="read-ahead", daemon=True)
+    thread.start()
+    try:
+        while True:
+            item = buffer.get()
+            if item is finished:
+                break
+            yield item
+        if errors:
+            raise errors[0]
+    finally:
+        stop.set()
+        thread.join()
+
+class TokenBucket:
+    """
+    Thread-safe token bucket allowing `rate` actions per second on average,
+    with bursts of up to `capacity` (default: one second's worth).
+    """
+    
+    def __init__(self, rate: float, capacity: float = None):
+        self.rate = rate
+        self.capacity = capacity or max(rate, 1)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        """Take one token, sleeping until it is available."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # Going negative reserves a future token, so waiting threads queue up fairly
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0
+        if wait:
+            time.sleep(wait)
+
+class ConcurrencyLimit:
+    """
+    Context manager letting at most `limit` threads inside at once; unlike a
+    semaphore the limit can be changed while threads are waiting.
+    """
+    
+    def __init__(self, limit: int):
+        self.limit = limit
+        self._active = 0
+        self._condition = threading.Condition()
+    
+    def __enter__(self):
+        with self._condition:
+            while self._active >= self.limit:
+                self._condition.wait()
+            self._active += 1
+    
+    def __exit__(self, *exc_info):
+        with self._condition:
+            self._active -= 1
+            self._condition.notify()
+    
+    def set_limit(self, limit: int):
+        """Change the limit, waking waiting threads if it was raised."""
+        with self._condition:
+            self.limit = limit
+            self._condition.notify_all()
+
 class MailCheckerAddon(EmailCheckerAddon):
     """
     Mail checker addon for email validation and deliverability checking.
@@ -67,6 +228,75 @@ class MailCheckerAddon(EmailCheckerAddon):
         self.max_workers = self.config.get('max_workers', 10)
         self.max_requests_total = self.config.get('max_requests_total', None)
         self.api_timeout = self.config.get('api_timeout', 3600)  # seconds
+        # A claimed page waits for the previous page's checks and then runs its
+        # own, each bounded by api_timeout; other runs take it over only after that
+        self.claim_ttl = 2 * self.api_timeout + CLAIM_TTL_MARGIN
+        # Retries for refused connections and overload/5xx responses (0 = off)
+        self.api_retries = self.config.get('api_retries', 3)
+        # Optional cap on API requests per second across all worker threads
+        max_per_second = self.config.get('max_per_second')
+        self._rate_limiter = TokenBucket(max_per_second) if max_per_second else None
+        # Optional throughput goal: concurrency is tuned between batches from the
+        # observed API round-trip time (Little's law), with max_workers as ceiling
+        self.target_per_second = self.config.get('target_per_second')
+        self._concurrency = ConcurrencyLimit(self.max_workers) if self.target_per_second else None
+        self._rtts = deque(maxlen=512)
+        # Shared by all worker threads so API connections are kept alive and reused
+        self._session = requests.Session()
+        # Database managers by path; their connections stay open until cleanup()
+        self._db_managers = {}
+        # One pooled connection per worker thread. Transient failures are retried
+        # inside urllib3 with backoff (honouring Retry-After on 429/503). Read
+        # timeouts are not: a check can legitimately run up to api_timeout, and
+        # repeating it would multiply that wait. When retries run out the last
+        # response is returned, so the check is recorded as http_error_<status>
+        adapter = HTTPAdapter(
+            pool_connections=self.max_workers,
+            pool_maxsize=self.max_workers * 2,
+            max_retries=Retry(
+                total=self.api_retries,
+                read=0,
+                backoff_factor=0.5,
+                status_forcelist=(429, 500, 502, 503, 504),
+                allowed_methods=frozenset({'POST'}),
+                respect_retry_after_header=True,
+                raise_on_status=False
+            )
+        )
+        self._session.mount(self.api_endpoint.split('://', 1)[0] + '://', adapter)
+        # requests re-reads proxy variables and ~/.netrc on every call unless told
+        # not to; neither applies to a checker running on this machine
+        if urlparse(self.api_endpoint).hostname in LOCAL_HOSTS:
+            self._session.trust_env = False
+        # Everything but the body is fixed per addon, so it is bound once here
+        self._send = functools.partial(
+            self._session.post, self.api_endpoint, headers=API_HEADERS, timeout=self.api_timeout
+        )
+    
+    def cleanup(self):
+        """Stop the worker threads and close the HTTP session and all database connections."""
+        super().cleanup()
+        self._session.close()
+        # Closing the last connection checkpoints the WAL back into the database file
+        for db_manager in self._db_managers.values():
+            db_manager.close()
+        self._db_managers.clear()
+    
+    def _get_db_manager(self, db_path: str):
+        """
+        Get the database manager for a database, creating it on first use.
+        
+        Args:
+            db_path: Path to the database
+            
+        Returns:
+            EmailDatabaseManager whose connections are reused by every call
+        """
+        db_manager = self._db_managers.get(db_path)
+        if db_manager is None:
+            EmailDatabaseManager = _load_db_manager()
+            db_manager = self._db_managers[db_path] = EmailDatabaseManager(db_path)
+        return db_manager
     
     def get_source_name(self) -> str:
         """Return the source name for this addon."""
@@ -83,39 +313,93 @@ class MailCheckerAddon(EmailCheckerAddon):
         Returns:
             Dictionary with validation results
         """
-        headers = {"Content-Type": "application/json"}
+        domain = email.rsplit('@', 1)[-1].lower()
+        cached = self.get_cached_domain_result(domain)
+        if cached is not None:
+            logger.debug("Domain %s accepts no mail (cached), skipping API for: %s", domain, email)
+            return {**cached, 'email': email, 'company_id': company_id}
+        
         data = {"to_email": email}
         
         try:
-            logger.debug(f"Checking email: {email}")
-            response = requests.post(self.api_endpoint, headers=headers, json=data, timeout=self.api_timeout)
+            if self._rate_limiter:
+                self._rate_limiter.acquire()
+            logger.debug("Checking email: %s", email)
+            response = self._post(data)
             response.raise_for_status()
-            json_response = response.json()
+            json_response = _json_loads(response.content)
+            
+            # No mail server for the domain: the outcome holds for all its addresses.
+            # Only the domain-level parts are cached; syntax, misc and smtp are per address
+            mx = json_response.get('mx') or {}
+            if mx.get('accepts_mail') is False:
+                self.cache_domain_result(domain, {
+                    'is_reachable': json_response.get('is_reachable'),
+                    'mx': dict(mx)
+                })
             
             # Add email to response for tracking
             json_response['email'] = email
             json_response['company_id'] = company_id
             
-            logger.debug(f"Email check completed for: {email}")
+            logger.debug("Email check completed for: %s", email)
             return json_response
             
         except requests.exceptions.Timeout:
-            logger.warning(f"Timeout occurred for email: {email}")
+            logger.warning("Timeout occurred for email: %s", email)
             return {'email': email, 'error': 'timeout', 'company_id': company_id}
         except requests.exceptions.HTTPError as e:
-            logger.error(f"HTTP Error {e.response.status_code} for email {email}: {e.response.text}")
+            logger.error("HTTP Error %s for email %s: %s", e.response.status_code, email, e.response.text)
             return {'email': email, 'error': f'http_error_{e.response.status_code}', 'company_id': company_id}
         except requests.exceptions.ConnectionError as e:
-            logger.error(f"Connection Error for email {email}: {e}")
+            logger.error("Connection Error for email %s: %s", email, e)
             return {'email': email, 'error': 'connection_error', 'company_id': company_id}
         except requests.exceptions.RequestException as e:
-            logger.error(f"Request Exception for email {email}: {e}")
+            logger.error("Request Exception for email %s: %s", email, e)
             return {'email': email, 'error': 'request_exception', 'company_id': company_id}
         except json.JSONDecodeError as e:
-            logger.error(f"JSON Decode Error for email {email}: {e}")
+            logger.error("JSON Decode Error for email %s: %s", email, e)
             return {'email': email, 'error': 'json_decode_error', 'company_id': company_id}
     
-    def process_email_data(self, api_response: Dict[str, Any]) -> Dict[str, Any]:
+    def _safe_check_email(self, email: str, company_id: int = None) -> Dict[str, Any]:
+        """
+        Check one email, turning an exception into an error result.
+        
+        The error is stored as exception_<type>, marking the email as checked so
+        it isn't retried forever.
+        """
+        try:
+            return self.check_email(email, company_id)
+        except Exception as e:
+            logger.error("Error checking email %s: %s", email, e)
+            return {'email': email, 'error': f'exception_{type(e).__name__}', 'company_id': company_id}
+    
+    def _post(self, data: Dict[str, Any]):
+        """Send one check request, recording its round-trip time when tuning concurrency."""
+        # Encoded here rather than via json=, which always goes through the stdlib encoder
+        body = _json_dumps(data)
+        if self._concurrency is None:
+            return self._send(data=body)
+        
+        with self._concurrency:
+            started = time.perf_counter()
+            try:
+                return self._send(data=body)
+            finally:
+                self._rtts.append(time.perf_counter() - started)
+    
+    def _tune_concurrency(self):
+        """Set the number of concurrent API requests needed for target_per_second."""
+        if self._concurrency is None or not self._rtts:
+            return
+        
+        rtt = statistics.median(self._rtts)
+        limit = min(self.max_workers, max(1, math.ceil(self.target_per_second * rtt)))
+        if limit != self._concurrency.limit:
+            logger.info(f"Median API round trip {rtt:.3f}s: using {limit} concurrent requests")
+            self._concurrency.set_limit(limit)
+    
+    def process_email_data(self, api_response: Dict[str, Any]) -> CheckResult:
         """
         Process API response and extract relevant data for database update.
         Always returns data to ensure email gets marked as checked.
@@ -124,78 +408,76 @@ class MailCheckerAddon(EmailCheckerAddon):
             api_response: Response from email checking API
 
         Returns:
-            Dictionary of processed data (always returns data, even for errors)
+            CheckResult of processed data (always returns data, even for errors)
         """
-        processed_data = {}
+        # Successful responses always carry is_reachable, while the error dicts
+        # built by check_email never do, so one lookup settles the common case
+        is_reachable = api_response.get('is_reachable') if api_response else None
 
         # Handle error responses - still mark as checked but store error info
-        if not api_response or 'error' in api_response:
+        if is_reachable is None and (not api_response or 'error' in api_response):
             error_type = api_response.get('error', 'unknown_error') if api_response else 'no_response'
-            processed_data['check_error'] = error_type
-            logger.warning(f"API error for email check: {error_type}")
-            return processed_data
-
-        # Process successful response
-        processed_data = {
-            'is_reachable': api_response.get('is_reachable'),
-            'mx_accepts_mail': api_response.get('mx', {}).get('accepts_mail'),
-            'records': json.dumps(api_response.get('mx', {}).get('records', []))
-        }
-
-        # Add misc data
-        misc = api_response.get('misc', {})
-        processed_data['is_disposable'] = misc.get('is_disposable')
-        processed_data['is_role_account'] = misc.get('is_role_account')
-
-        # Add syntax data
-        syntax = api_response.get('syntax', {})
-        processed_data['is_valid_syntax'] = syntax.get('is_valid_syntax')
-
-        # Add SMTP data
-        smtp = api_response.get('smtp', {})
-        processed_data['can_connect_smtp'] = smtp.get('can_connect_smtp')
-        processed_data['is_deliverable'] = smtp.get('is_deliverable')
-        processed_data['is_catch_all'] = smtp.get('is_catch_all')
-        processed_data['has_full_inbox'] = smtp.get('has_full_inbox')
-        processed_data['is_disabled'] = smtp.get('is_disabled')
-
-        return processed_data
-
-    def _update_email_with_retry(self, db_manager, email_id: int, processed_data: Dict[str, Any], email: str, max_retries: int = 3) -> bool:
+            # Counted in the per-batch summary; details only at debug level
+            logger.debug("API error for email check: %s", error_type)
+            return CheckResult(check_error=error_type)
+
+        # Process successful response. A section may be missing or null; the result
+        # is built positionally (CheckResult field order), which skips keyword
+        # matching on every response
+        get = api_response.get
+        mx = get('mx') or _EMPTY
+        misc = get('misc') or _EMPTY
+        syntax = get('syntax') or _EMPTY
+        smtp = get('smtp') or _EMPTY
+
+        return CheckResult(
+            is_reachable,
+            mx.get('accepts_mail'),
+            # Encoded to JSON by the database manager when stored
+            mx.get('records', []),
+            misc.get('is_disposable'),
+            misc.get('is_role_account'),
+            syntax.get('is_valid_syntax'),
+            smtp.get('can_connect_smtp'),
+            smtp.get('is_deliverable'),
+            smtp.get('is_catch_all'),
+            smtp.get('has_full_inbox'),
+            smtp.get('is_disabled')
+        )
+
+    def _update_emails_with_retry(self, db_manager, pending_updates: List[tuple], max_retries: int = 3) -> int:
         """
-        Update email with retry logic for database operations.
+        Write a batch of check results in one transaction, with retry logic.
 
         Args:
             db_manager: Database manager instance
-            email_id: Email ID to update
-            processed_data: Data to update
-            email: Email address for logging
+            pending_updates: List of (email_id, processed_data) tuples
             max_retries: Maximum number of retry attempts
 
         Returns:
-            True if successful, False otherwise
+            Number of email records updated
         """
+        if not pending_updates:
+            return 0
+
         for attempt in range(max_retries):
             try:
-                success = db_manager.update_email_check_results(email_id, processed_data)
-                if success:
-                    return True
-                else:
-                    logger.warning(f"Database update failed for {email} (attempt {attempt + 1}/{max_retries})")
-                    if attempt < max_retries - 1:
-                        time.sleep(0.1 * (attempt + 1))  # Exponential backoff
+                updated = db_manager.update_email_check_results_batch(pending_updates)
+                if updated:
+                    return updated
+                logger.warning(f"Database update failed for {len(pending_updates)} emails (attempt {attempt + 1}/{max_retries})")
             except Exception as e:
-                logger.error(f"Database error for {email} (attempt {attempt + 1}/{max_retries}): {e}")
-                if attempt < max_retries - 1:
-                    time.sleep(0.1 * (attempt + 1))  # Exponential backoff
+                logger.error(f"Database error for {len(pending_updates)} emails (attempt {attempt + 1}/{max_retries}): {e}")
+            if attempt < max_retries - 1:
+                time.sleep(0.1 * (attempt + 1))  # Exponential backoff
 
-        # Final attempt to mark as checked with error
+        # Final attempt to mark the batch as checked with error
         try:
-            error_data = {'check_error': 'persistent_database_error'}
-            return db_manager.update_email_check_results(email_id, error_data)
+            error_data = CheckResult(check_error='persistent_database_error')
+            db_manager.update_email_check_results_batch([(email_id, error_data) for email_id, _ in pending_updates])
         except Exception as e:
-            logger.error(f"Failed to mark email {email} as checked after all retries: {e}")
-            return False
+            logger.error(f"Failed to mark {len(pending_updates)} emails as checked after all retries: {e}")
+        return 0
 
     def check_emails_from_database(self, db_path: str, limit: int = None, source_filter: str = None) -> int:
         """
@@ -209,107 +491,174 @@ class MailCheckerAddon(EmailCheckerAddon):
         Returns:
             Number of emails successfully checked
         """
-        # Import here to avoid circular imports
-        # Get the correct path to addons directory
-        current_file = os.path.abspath(__file__)
-        checker_dir = os.path.dirname(current_file)         # addons/mail-checker
-        addons_dir = os.path.dirname(checker_dir)           # addons
-
-        # Import directly from the addons directory
-        import importlib.util
-        db_manager_path = os.path.join(addons_dir, 'database_manager.py')
-        spec = importlib.util.spec_from_file_location("database_manager", db_manager_path)
-        database_manager_module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(database_manager_module)
-        EmailDatabaseManager = database_manager_module.EmailDatabaseManager
-        db_manager = EmailDatabaseManager(db_path)
+        db_manager = self._get_db_manager(db_path)
 
         # Ensure database tables have required schema
         db_manager.ensure_emails_table()
         db_manager.ensure_companies_table_columns()
 
-        # Get unchecked emails
-        unchecked_emails = db_manager.get_unchecked_emails(limit=limit, source=source_filter)
+        # Count unchecked emails; the rows themselves are streamed batch by batch
+        unchecked_count = db_manager.count_unchecked_emails(source=source_filter)
+        if limit:
+            unchecked_count = min(unchecked_count, limit)
         
-        if not unchecked_emails:
+        if not unchecked_count:
             logger.info("No unchecked emails found")
             return 0
 
-        logger.info(f"Found {len(unchecked_emails)} unchecked emails to process")
+        logger.info(f"Found {unchecked_count} unchecked emails to process")
+        # Rows are claimed for this run, so parallel checker processes skip them.
+        # The next page is claimed on a background thread while this one is checked
+        claim_id = uuid.uuid4().hex
+        unchecked_emails = _read_ahead(
+            self._iter_claimed_emails(db_manager, claim_id, limit=limit, source=source_filter),
+            self.batch_size
+        )
         
         total_checked = 0
         total_requests_made = 0
-        
-        # Process in batches
-        for i in range(0, len(unchecked_emails), self.batch_size):
-            if self.max_requests_total and total_requests_made >= self.max_requests_total:
-                logger.info(f"Reached maximum requests limit ({self.max_requests_total}). Stopping.")
-                break
 
-            batch = unchecked_emails[i:i + self.batch_size]
-            logger.info(f"Processing batch {i//self.batch_size + 1}: {len(batch)} emails")
+        # The addon's pool outlives the run, so worker threads (and their
+        # kept-alive API connections) survive from batch to batch and run to run
+        executor = self._get_executor()
+        # Single writer thread: batch N is committed while batch N+1 is being checked
+        db_writer = ThreadPoolExecutor(max_workers=1)
+        pending_write = None
+
+        # Requests are topped up as they complete (no per-batch barrier); twice the
+        # worker count keeps every worker busy while results are being processed
+        window = self.max_workers * 2
+        in_flight = {}  # future -> address
+        # The same address can be stored for several companies; check it once
+        rows_by_email = {}  # address -> rows waiting on its request
+        more_rows = True
+
+        # Results are written in one transaction per batch_size rows
+        pending_updates = []
+        batch = Counter()  # per-batch outcome counts, reported once per batch
+        batch_number = 0
+
+        def finish_write(write):
+            nonlocal total_checked
+            future, batch_checked, batch_len = write
+            if future.result():
+                total_checked += batch_checked
+                logger.debug("Updated email check results for %d emails", batch_len)
+            else:
+                logger.error(f"Failed to update database for batch of {batch_len} emails after all retries")
+
+        def flush_batch():
+            nonlocal pending_updates, pending_write, batch, batch_number
+            batch_number += 1
+            logger.info(
+                "Batch %d: %d emails, %d ok, %d API errors, %d exceptions, %d invalid syntax",
+                batch_number, len(pending_updates), batch['ok'], batch['api_errors'],
+                batch['exceptions'], batch['invalid']
+            )
+
+            # Keep at most one batch waiting on the database
+            if pending_write:
+                finish_write(pending_write)
+            pending_write = (
+                db_writer.submit(self._update_emails_with_retry, db_manager, pending_updates),
+                batch['checked'],
+                len(pending_updates)
+            )
+            pending_updates = []
+            batch = Counter()
+
+            self._tune_concurrency()
 
-            # Calculate how many requests we can still make in this batch
-            remaining_requests = None
-            if self.max_requests_total:
-                remaining_requests = self.max_requests_total - total_requests_made
-                if remaining_requests <= 0:
+        try:
+            while True:
+                # Top up the requests in flight from the database
+                while more_rows and len(in_flight) < window:
+                    if self.max_requests_total and total_requests_made + len(in_flight) >= self.max_requests_total:
+                        logger.info(f"Reached maximum requests limit ({self.max_requests_total}). Stopping.")
+                        more_rows = False
+                        break
+
+                    email_data = next(unchecked_emails, None)
+                    if email_data is None:
+                        more_rows = False
+                        break
+
+                    address = email_data['email'].lower()
+                    if address in rows_by_email:
+                        # Already being checked; share that result
+                        rows_by_email[address].append(email_data)
+                    elif EMAIL_SYNTAX_RE.match(address):
+                        rows_by_email[address] = [email_data]
+                        future = executor.submit(self._safe_check_email, email_data['email'], email_data['company_id'])
+                        in_flight[future] = address
+                    else:
+                        # Malformed: marked invalid locally instead of costing an API request
+                        processed_data = self.process_email_data(self._invalid_syntax_result(address))
+                        pending_updates.append((email_data['id'], processed_data))
+                        batch['checked'] += 1
+                        batch['invalid'] += 1
+
+                if not in_flight:
                     break
-                # Limit batch to remaining requests
-                batch = batch[:remaining_requests]
-
-            # Use ThreadPoolExecutor for concurrent API requests
-            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-                # Submit email checking tasks
-                future_to_email = {
-                    executor.submit(self.check_email, email_data['email'], email_data['company_id']): email_data
-                    for email_data in batch
-                }
-
-                # Process all submitted futures to completion
-                for future in as_completed(future_to_email):
-                    email_data = future_to_email[future]
-
-                    try:
-                        # Get the API response
-                        api_response = future.result()
+
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    rows = rows_by_email.pop(in_flight.pop(future))
+
+                    # Failures come back as error results, never as raised exceptions
+                    processed_data = self.process_email_data(future.result())
+                    check_error = processed_data.check_error
+                    if check_error and check_error.startswith('exception_'):
+                        batch['exceptions'] += 1
+                    else:
                         total_requests_made += 1
+                        batch['checked'] += len(rows)
+                        batch['api_errors' if check_error else 'ok'] += 1
+
+                    # Always update database (even for errors), once per stored row
+                    pending_updates.extend((email_data['id'], processed_data) for email_data in rows)
+
+                if len(pending_updates) >= self.batch_size:
+                    flush_batch()
+
+            if pending_updates:
+                flush_batch()
+            if pending_write:
+                finish_write(pending_write)
+        finally:
+            unchecked_emails.close()
+            db_writer.shutdown()
+            # Hand back rows claimed ahead but never checked (e.g. max_requests reached)
+            db_manager.release_email_claims(claim_id)
 
-                        # Process the response (always returns data now)
-                        processed_data = self.process_email_data(api_response)
-
-                        # Always try to update database (even for errors) with retry logic
-                        success = self._update_email_with_retry(
-                            db_manager,
-                            email_data['id'],
-                            processed_data,
-                            email_data['email']
-                        )
-
-                        if success:
-                            total_checked += 1
-                            logger.debug(f"Updated email check results for: {email_data['email']}")
-                        else:
-                            logger.error(f"Failed to update database for: {email_data['email']} after all retries")
-
-                    except Exception as exc:
-                        logger.error(f"Error checking email {email_data['email']}: {exc}")
-                        # Mark as checked with error to prevent infinite retries
-                        error_data = {'check_error': f'exception_{type(exc).__name__}'}
-                        self._update_email_with_retry(
-                            db_manager,
-                            email_data['id'],
-                            error_data,
-                            email_data['email']
-                        )
-
-            # Small delay between batches
-            time.sleep(0.1)
-        
         logger.info(f"Email checking completed! Checked {total_checked} emails successfully")
         logger.info(f"Total API requests made: {total_requests_made}")
         return total_checked
 
+    def _iter_claimed_emails(self, db_manager, claim_id: str, limit: int = None,
+                             source: str = None) -> Iterator[Dict[str, Any]]:
+        """
+        Yield unchecked emails, claiming them a page (batch_size rows) at a time.
+        
+        Args:
+            db_manager: Database manager instance
+            claim_id: Identifier of this checker run
+            limit: Maximum number of emails to claim
+            source: Optional filter by email source
+            
+        Yields:
+            Email dictionaries
+        """
+        remaining = limit or None
+        while remaining is None or remaining > 0:
+            page_size = self.batch_size if remaining is None else min(self.batch_size, remaining)
+            page = db_manager.claim_unchecked_emails(claim_id, page_size, source=source, ttl=self.claim_ttl)
+            if not page:
+                return
+            yield from page
+            if remaining is not None:
+                remaining -= len(page)
+
     def get_email_check_stats(self, db_path: str) -> Dict[str, int]:
         """
         Get statistics about email checking status.
@@ -320,46 +669,31 @@ class MailCheckerAddon(EmailCheckerAddon):
         Returns:
             Dictionary with email checking statistics
         """
-        # Import database manager
-        current_file = os.path.abspath(__file__)
-        checker_dir = os.path.dirname(current_file)
-        addons_dir = os.path.dirname(checker_dir)
-
-        import importlib.util
-        db_manager_path = os.path.join(addons_dir, 'database_manager.py')
-        spec = importlib.util.spec_from_file_location("database_manager", db_manager_path)
-        database_manager_module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(database_manager_module)
-        EmailDatabaseManager = database_manager_module.EmailDatabaseManager
-        db_manager = EmailDatabaseManager(db_path)
+        db_manager = self._get_db_manager(db_path)
 
         try:
-            with db_manager.get_connection() as conn:
-                cursor = conn.cursor()
-
-                # Get total emails
-                cursor.execute("SELECT COUNT(*) FROM emails")
-                total_emails = cursor.fetchone()[0]
-
-                # Get checked emails
-                cursor.execute("SELECT COUNT(*) FROM emails WHERE checked_at IS NOT NULL")
-                checked_emails = cursor.fetchone()[0]
-
-                # Get emails with errors
-                cursor.execute("SELECT COUNT(*) FROM emails WHERE check_error IS NOT NULL")
-                error_emails = cursor.fetchone()[0]
-
-                # Get emails by source
-                cursor.execute("SELECT source, COUNT(*) FROM emails GROUP BY source")
-                source_counts = dict(cursor.fetchall())
-
-                return {
-                    'total_emails': total_emails,
-                    'checked_emails': checked_emails,
-                    'unchecked_emails': total_emails - checked_emails,
-                    'error_emails': error_emails,
-                    'source_counts': source_counts
-                }
+            with db_manager.get_connection(readonly=True) as conn:
+                # Every count in one pass over the table, per source
+                rows = conn.execute("""
+                    SELECT source, COUNT(*), COUNT(checked_at), COUNT(check_error)
+                    FROM emails GROUP BY source
+                """).fetchall()
+
+            source_counts = {}
+            total_emails = checked_emails = error_emails = 0
+            for source, total, checked, errors in rows:
+                source_counts[source] = total
+                total_emails += total
+                checked_emails += checked
+                error_emails += errors
+
+            return {
+                'total_emails': total_emails,
+                'checked_emails': checked_emails,
+                'unchecked_emails': total_emails - checked_emails,
+                'error_emails': error_emails,
+                'source_counts': source_counts
+            }
         except Exception as e:
             logger.error(f"Error getting email check stats: {e}")
             return {}
@@ -367,9 +701,7 @@ class MailCheckerAddon(EmailCheckerAddon):
 def load_geo_mail_config():
     """Load configuration from geo_mail config/config.ini."""
     import configparser
-    # Go up two levels from addons/mail-checker to geo_mail root
-    geo_mail_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-    config_path = os.path.join(geo_mail_root, 'config', 'config.ini')
+    config_path = os.path.join(_GEO_MAIL_ROOT, 'config', 'config.ini')
     config = configparser.ConfigParser()
     config.read(config_path)
     return config
@@ -385,6 +717,8 @@ def main():
     parser.add_argument("--batch-size", type=int, default=200, help="Batch size for processing")
     parser.add_argument("--max-workers", type=int, default=10, help="Maximum worker threads")
     parser.add_argument("--max-requests", type=int, help="Maximum total requests")
+    parser.add_argument("--max-per-second", type=float, help="Maximum API requests per second")
+    parser.add_argument("--target-per-second", type=float, help="Tune concurrency (up to --max-workers) for this many requests per second")
     parser.add_argument("--limit", type=int, help="Limit number of emails to process (if not set, processes all unchecked emails)")
     parser.add_argument("--source", help="Filter by email source (static, harvester, scraper)")
     parser.add_argument("--api-endpoint", default="http://localhost:8080/v0/check_email", help="API endpoint")
@@ -397,92 +731,97 @@ def main():
         config_batch_size = geo_config.getint("EmailChecker", "batch_size", fallback=200)
         config_max_workers = geo_config.getint("EmailChecker", "max_workers", fallback=10)
         config_api_endpoint = geo_config.get("EmailChecker", "api_endpoint", fallback="http://localhost:8080/v0/check_email")
+        config_max_per_second = geo_config.getfloat("EmailChecker", "max_per_second", fallback=0)
+        config_target_per_second = geo_config.getfloat("EmailChecker", "target_per_second", fallback=0)
+        config_api_retries = geo_config.getint("EmailChecker", "api_retries", fallback=3)
     except:
         config_batch_size = 200
         config_max_workers = 10
         config_api_endpoint = "http://localhost:8080/v0/check_email"
+        config_max_per_second = 0
+        config_target_per_second = 0
+        config_api_retries = 3
 
     # Configure addon - use config.ini values if available, otherwise use command line args
     config = {
         'api_endpoint': args.api_endpoint if args.api_endpoint != "http://localhost:8080/v0/check_email" else config_api_endpoint,
         'batch_size': args.batch_size if args.batch_size != 200 else config_batch_size,
         'max_workers': args.max_workers if args.max_workers != 10 else config_max_workers,
-        'max_requests_total': args.max_requests
+        'max_requests_total': args.max_requests,
+        'max_per_second': args.max_per_second if args.max_per_second is not None else config_max_per_second,
+        'target_per_second': args.target_per_second if args.target_per_second is not None else config_target_per_second,
+        'api_retries': config_api_retries
     }
 
-    checker = MailCheckerAddon(config)
+    # Closes the HTTP session and database connections however the command ends
+    with MailCheckerAddon(config) as checker:
+        if args.email:
+            # Check single email
+            result = checker.check_email(args.email)
+            print(f"Result for {args.email}:")
+            print(json.dumps(result, indent=2))
+
+        elif args.all_emails:
+            # Check all unchecked emails from geo_mail database
+            geo_config = load_geo_mail_config()
+            db_name = geo_config.get("Database", "db_name", fallback="google_maps_companies.db")
+
+            # Database paths are relative to the geo_mail root
+            db_path = os.path.join(_GEO_MAIL_ROOT, db_name)
+
+            logger.info(f"Using database: {db_path}")
+            logger.info(f"API endpoint: {config['api_endpoint']}")
+            logger.info(f"Batch size: {config['batch_size']}")
+            logger.info(f"Max workers (threads): {config['max_workers']}")
+            if args.source:
+                logger.info(f"Source filter: {args.source}")
+            if args.limit:
+                logger.info(f"Limit: {args.limit}")
+
+            # Check emails from database
+            checked_count = checker.check_emails_from_database(
+                db_path,
+                limit=args.limit,
+                source_filter=args.source
+            )
+            logger.info(f"Successfully checked {checked_count} emails")
+
+        elif args.stats:
+            # Show email checking statistics
+            geo_config = load_geo_mail_config()
+            db_name = geo_config.get("Database", "db_name", fallback="google_maps_companies.db")
+
+            db_path = os.path.join(_GEO_MAIL_ROOT, db_name)
+
+            stats = checker.get_email_check_stats(db_path)
+
+            if stats:
+                print("\n" + "=" * 50)
+                print("EMAIL CHECKING STATISTICS")
+                print("=" * 50)
+                print(f"Total emails in database: {stats['total_emails']}")
+                print(f"Checked emails: {stats['checked_emails']}")
+                print(f"Unchecked emails: {stats['unchecked_emails']}")
+                print(f"Emails with errors: {stats['error_emails']}")
+                print("\nEmails by source:")
+                for source, count in stats['source_counts'].items():
+                    print(f"  {source}: {count}")
+                print("=" * 50)
+            else:
+                print("Failed to retrieve statistics")
 
-    if args.email:
-        # Check single email
-        result = checker.check_email(args.email)
-        print(f"Result for {args.email}:")
-        print(json.dumps(result, indent=2))
-
-    elif args.all_emails:
-        # Check all unchecked emails from geo_mail database
-        geo_config = load_geo_mail_config()
-        db_name = geo_config.get("Database", "db_name", fallback="google_maps_companies.db")
-
-        # Construct full database path (go up two levels from addons/mail-checker to geo_mail root)
-        geo_mail_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-        db_path = os.path.join(geo_mail_root, db_name)
-
-        logger.info(f"Using database: {db_path}")
-        logger.info(f"API endpoint: {config['api_endpoint']}")
-        logger.info(f"Batch size: {config['batch_size']}")
-        logger.info(f"Max workers (threads): {config['max_workers']}")
-        if args.source:
-            logger.info(f"Source filter: {args.source}")
-        if args.limit:
-            logger.info(f"Limit: {args.limit}")
-
-        # Check emails from database
-        checked_count = checker.check_emails_from_database(
-            db_path,
-            limit=args.limit,
-            source_filter=args.source
-        )
-        logger.info(f"Successfully checked {checked_count} emails")
-
-    elif args.stats:
-        # Show email checking statistics
-        geo_config = load_geo_mail_config()
-        db_name = geo_config.get("Database", "db_name", fallback="google_maps_companies.db")
-
-        # Construct full database path
-        geo_mail_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-        db_path = os.path.join(geo_mail_root, db_name)
-
-        checker = MailCheckerAddon(config)
-        stats = checker.get_email_check_stats(db_path)
-
-        if stats:
-            print("\n" + "=" * 50)
-            print("EMAIL CHECKING STATISTICS")
-            print("=" * 50)
-            print(f"Total emails in database: {stats['total_emails']}")
-            print(f"Checked emails: {stats['checked_emails']}")
-            print(f"Unchecked emails: {stats['unchecked_emails']}")
-            print(f"Emails with errors: {stats['error_emails']}")
-            print("\nEmails by source:")
-            for source, count in stats['source_counts'].items():
-                print(f"  {source}: {count}")
-            print("=" * 50)
         else:
-            print("Failed to retrieve statistics")
-
-    else:
-        print("Usage:")
-        print("  --email EMAIL                      Check single email")
-        print("  --all-emails                       Check all unchecked emails from geo_mail database")
-        print("  --stats                            Show email checking statistics")
-        print("  --source SOURCE                    Filter by email source (static, harvester, scraper)")
-        print("  --limit N                          Limit number of emails to check (optional - processes all if not set)")
-        print("  --batch-size N                     Batch size for processing")
-        print("  --max-workers N                    Maximum worker threads")
-        print("  --max-requests N                   Maximum total requests")
-        print("  --api-endpoint URL                 Email checking API endpoint")
-        sys.exit(1)
+            print("Usage:")
+            print("  --email EMAIL                      Check single email")
+            print("  --all-emails                       Check all unchecked emails from geo_mail database")
+            print("  --stats                            Show email checking statistics")
+            print("  --source SOURCE                    Filter by email source (static, harvester, scraper)")
+            print("  --limit N                          Limit number of emails to check (optional - processes all if not set)")
+            print("  --batch-size N                     Batch size for processing")
+            print("  --max-workers N                    Maximum worker threads")
+            print("  --max-requests N                   Maximum total requests")
+            print("  --api-endpoint URL                 Email checking API endpoint")
+            sys.exit(1)
 
 if __name__ == "__main__":
     main()
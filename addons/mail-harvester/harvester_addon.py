@@ -32,17 +32,24 @@ Uses theHarvester for OSINT email discovery from various sources.
 """
 
 import subprocess
+import functools
+import importlib.util
 import json
 import os
 import re
-import tempfile
+import secrets
+import sqlite3
 import time
+from concurrent.futures import as_completed
+from types import MappingProxyType
 from urllib.parse import urlparse
-from typing import List, Dict, Set, Optional, Any
+from typing import List, Dict, Set, Optional, Any, Iterator, Mapping
 
 # Add parent directory to path for imports
 import sys
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_HERE = os.path.dirname(os.path.abspath(__file__))
+_ADDONS_DIR = os.path.dirname(_HERE)
+sys.path.append(_ADDONS_DIR)
 
 from base_addon import EmailFinderAddon, EmailResult, CompanyInfo
 from addon_logger import setup_addon_logging
@@ -50,6 +57,27 @@ from addon_logger import setup_addon_logging
 # Set up logging for this addon
 logger = setup_addon_logging("mail-harvester")
 
+# Database runs store results every HARVEST_WRITE_BATCH companies or
+# HARVEST_WRITE_INTERVAL seconds, whichever comes first
+HARVEST_WRITE_BATCH = 50
+HARVEST_WRITE_INTERVAL = 5.0
+
+# Compiled once; used for every company and every harvested string
+_DOMAIN_RE = re.compile(r'^[a-zA-Z0-9]([a-zA-Z0-9\-]{0,61}[a-zA-Z0-9])?(\.[a-zA-Z0-9]([a-zA-Z0-9\-]{0,61}[a-zA-Z0-9])?)*$')
+_EMAIL_FINDALL_RE = re.compile(r'\b[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}\b')
+
+def _iter_strings(obj: Any) -> Iterator[str]:
+    """Yield every string (dict keys and values, list items) in parsed JSON."""
+    if isinstance(obj, str):
+        yield obj
+    elif isinstance(obj, dict):
+        for key, value in obj.items():
+            yield key
+            yield from _iter_strings(value)
+    elif isinstance(obj, list):
+        for item in obj:
+            yield from _iter_strings(item)
+
 class MailHarvesterAddon(EmailFinderAddon):
     """
     Mail harvester addon using theHarvester for OSINT email discovery.
@@ -123,7 +151,7 @@ class MailHarvesterAddon(EmailFinderAddon):
         domain = domain.split('/')[0].split('?')[0].split('#')[0]
         
         # Basic domain validation
-        if not re.match(r'^[a-zA-Z0-9]([a-zA-Z0-9\-]{0,61}[a-zA-Z0-9])?(\.[a-zA-Z0-9]([a-zA-Z0-9\-]{0,61}[a-zA-Z0-9])?)*$', domain):
+        if not _DOMAIN_RE.match(domain):
             return None
         
         # Must have at least one dot
@@ -132,53 +160,37 @@ class MailHarvesterAddon(EmailFinderAddon):
         
         return domain.lower()
     
-    def _is_valid_email(self, email: str) -> bool:
-        """Basic email validation."""
-        if not email or not isinstance(email, str):
-            return False
-        
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return bool(re.match(pattern, email.strip()))
-    
     def _extract_emails_from_json(self, json_file_path: str) -> Set[str]:
-        """Extract emails from theHarvester JSON output."""
-        emails = set()
+        """
+        Extract emails from theHarvester JSON output.
         
+        The file text is scanned directly; it is only parsed as JSON when it
+        contains \\u escapes, which could hide or split addresses.
+        """
         try:
-            with open(json_file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            # Check common fields where emails might be stored
-            email_fields = ['emails', 'email', 'people']
-            
-            for field in email_fields:
-                if field in data:
-                    field_data = data[field]
-                    if isinstance(field_data, list):
-                        for item in field_data:
-                            if isinstance(item, str) and self._is_valid_email(item):
-                                emails.add(item.lower().strip())
-                            elif isinstance(item, dict) and 'email' in item:
-                                email = item['email']
-                                if self._is_valid_email(email):
-                                    emails.add(email.lower().strip())
-                    elif isinstance(field_data, str) and self._is_valid_email(field_data):
-                        emails.add(field_data.lower().strip())
-            
-            # Also check if the entire data structure contains email-like strings
-            json_str = json.dumps(data)
-            email_pattern = r'\b[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}\b'
-            found_emails = re.findall(email_pattern, json_str)
-            
-            for email in found_emails:
-                if self._is_valid_email(email):
-                    emails.add(email.lower().strip())
-            
-            return emails
-            
-        except (json.JSONDecodeError, FileNotFoundError, IOError) as e:
+            with open(json_file_path, 'rb') as f:
+                text = f.read().decode('utf-8', 'ignore')
+        except FileNotFoundError:
+            print(f"JSON output file not found: {json_file_path}")
+            return set()
+        except IOError as e:
+            logger.error(f"Error reading JSON file {json_file_path}: {e}")
+            return set()
+        
+        # Every match already satisfies the full email syntax; no second check needed
+        if '\\u' not in text:
+            return {email.lower() for email in _EMAIL_FINDALL_RE.findall(text)}
+        
+        emails = set()
+        try:
+            data = json.loads(text)
+        except json.JSONDecodeError as e:
             logger.error(f"Error reading JSON file {json_file_path}: {e}")
             return set()
+        
+        for value in _iter_strings(data):
+            emails.update(email.lower() for email in _EMAIL_FINDALL_RE.findall(value))
+        return emails
     
     def _run_harvester(self, domain: str, sources: List[str], limit: int, output_file: str) -> bool:
         """Run theHarvester for a specific domain and sources."""
@@ -198,13 +210,16 @@ class MailHarvesterAddon(EmailFinderAddon):
             
             logger.info(f"Running harvester for {domain} with sources: {sources_str}")
             
-            # Run the command
+            # Run the command. Results come from the JSON file and stdout is never
+            # read, so it is discarded rather than piped into this process; the
+            # worker thread just waits on the child (without holding the GIL)
             result = subprocess.run(
                 cmd,
-                capture_output=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 text=True,
                 timeout=self.timeout,
-                cwd=os.path.dirname(os.path.abspath(__file__))
+                cwd=_HERE
             )
             
             if result.returncode == 0:
@@ -250,49 +265,46 @@ class MailHarvesterAddon(EmailFinderAddon):
             print(f"No valid domain for company {company.id}")
             return results
         
-        # Create temporary output file
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False, dir=self.output_dir) as temp_file:
-            temp_output = temp_file.name.replace('.json', '')  # theHarvester adds .json automatically
+        # Unique output path; theHarvester creates <path>.json itself, so no
+        # placeholder file is created beforehand
+        temp_output = os.path.join(self.output_dir, f"harvest_{secrets.token_hex(8)}")
         
         try:
             # Run harvester with all sources
             success = self._run_harvester(domain, self.sources, self.limit_per_source, temp_output)
             
             if success:
-                # Extract emails from the JSON output
-                json_file = f"{temp_output}.json"
-                if os.path.exists(json_file):
-                    emails = self._extract_emails_from_json(json_file)
-                    
-                    for email in emails:
-                        result = EmailResult(
-                            email=email,
-                            source=self.get_source_name(),
-                            source_details=f"theHarvester OSINT discovery from sources: {', '.join(self.sources)}",
-                            confidence=self.confidence,  # Configurable confidence for OSINT discovered emails
-                            metadata={
-                                'domain': domain,
-                                'sources': self.sources,
-                                'harvester_version': 'theHarvester 4.8.0'
-                            }
-                        )
-                        results.append(result)
-                    
-                    print(f"Harvested {len(emails)} emails for domain: {domain}")
-                else:
-                    print(f"JSON output file not found: {json_file}")
+                # Extract emails from the JSON output (a missing file yields none)
+                emails = self._extract_emails_from_json(f"{temp_output}.json")
+                
+                for email in emails:
+                    result = EmailResult(
+                        email=email,
+                        source=self.get_source_name(),
+                        source_details=f"theHarvester OSINT discovery from sources: {', '.join(self.sources)}",
+                        confidence=self.confidence,  # Configurable confidence for OSINT discovered emails
+                        metadata={
+                            'domain': domain,
+                            'sources': self.sources,
+                            'harvester_version': 'theHarvester 4.8.0'
+                        }
+                    )
+                    results.append(result)
+                
+                print(f"Harvested {len(emails)} emails for domain: {domain}")
             else:
                 print(f"Harvester failed for domain: {domain}")
         
         finally:
-            # Clean up temporary files
-            for ext in ['.json', '.xml']:
+            # Clean up temporary files; removing directly saves a stat() per file
+            for ext in ('.json', '.xml'):
                 temp_file_path = f"{temp_output}{ext}"
-                if os.path.exists(temp_file_path):
-                    try:
-                        os.remove(temp_file_path)
-                    except OSError as e:
-                        print(f"Could not remove temporary file {temp_file_path}: {e}")
+                try:
+                    os.remove(temp_file_path)
+                except FileNotFoundError:
+                    pass
+                except OSError as e:
+                    print(f"Could not remove temporary file {temp_file_path}: {e}")
         
         return results
     
@@ -315,8 +327,28 @@ class MailHarvesterAddon(EmailFinderAddon):
         
         return True
 
+@functools.lru_cache(maxsize=1)
+def _load_db_manager():
+    """
+    Load EmailDatabaseManager from addons/database_manager.py once per process.
+    
+    Loaded by file path because modules/database_manager.py may shadow the
+    module name on sys.path.
+    """
+    db_manager_path = os.path.join(_ADDONS_DIR, 'database_manager.py')
+    spec = importlib.util.spec_from_file_location("database_manager", db_manager_path)
+    database_manager_module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(database_manager_module)
+    return database_manager_module.EmailDatabaseManager
+
+@functools.lru_cache(maxsize=1)
 def load_geo_mail_config():
-    """Load configuration from geo_mail config/config.ini."""
+    """
+    Load configuration from geo_mail config/config.ini.
+    
+    Cached: the file is parsed once per process and the same parser is
+    returned to every caller, so treat it as read-only.
+    """
     import configparser
     # Go up two levels from addons/mail-harvester to geo_mail root
     geo_mail_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -335,29 +367,23 @@ def get_database_column_config(geo_config):
         'existing_emails_column': geo_config.get("Database", "existing_emails_column", fallback="").strip()
     }
 
-def process_single_company_harvester(harvester, company_data, db_path, thread_id=None):
-    """Process a single company for email harvesting (thread-safe)."""
+@functools.lru_cache(maxsize=1)
+def _get_db_column_config() -> Mapping[str, str]:
+    """Database column configuration from the cached config (shared, read-only)."""
+    return MappingProxyType(get_database_column_config(load_geo_mail_config()))
 
-    company_id, company_name, website = company_data
+def process_single_company_harvester(harvester, company_data, thread_id=None):
+    """
+    Harvest emails for a single company (thread-safe).
 
-    # Load database column configuration
-    geo_config = load_geo_mail_config()
-    db_config = get_database_column_config(geo_config)
-
-    # Create a thread-local database manager for thread safety
-    # Get the correct path to addons directory
-    current_file = os.path.abspath(__file__)
-    harvester_dir = os.path.dirname(current_file)        # addons/mail-harvester
-    addons_dir = os.path.dirname(harvester_dir)          # addons
-
-    # Import directly from the addons directory
-    import importlib.util
-    db_manager_path = os.path.join(addons_dir, 'database_manager.py')
-    spec = importlib.util.spec_from_file_location("database_manager", db_manager_path)
-    database_manager_module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(database_manager_module)
-    EmailDatabaseManager = database_manager_module.EmailDatabaseManager
-    db_manager = EmailDatabaseManager(db_path, db_config['id_column'])
+    Nothing is written here: process_all_companies_from_db stores the results
+    of many companies in one transaction.
+
+    Returns:
+        (emails found, whether the harvester method completed) tuple
+    """
+
+    company_id, company_name, website = company_data
 
     thread_prefix = f"[Thread-{thread_id}] " if thread_id else ""
 
@@ -371,95 +397,70 @@ def process_single_company_harvester(harvester, company_data, db_path, thread_id
 
     try:
         emails = harvester.find_emails(company)
-
-        if emails:
-            # Store emails in database (thread-safe)
-            email_data = {company_id: emails}
-            added_count = db_manager.add_emails_batch(email_data)
-
-            # Update company tracking (thread-safe)
-            db_manager.update_company_methods(company_id, 'harvester', completed=True)
-
-            print(f"{thread_prefix}  Harvested {len(emails)} emails, stored {added_count} in database")
-
-            # Show all emails found
-            for email_result in emails:
-                print(f"{thread_prefix}    - {email_result.email}")
-
-            return len(emails)
-        else:
-            print(f"{thread_prefix}  No emails harvested for {website}")
-            # Still mark as completed even if no emails found
-            db_manager.update_company_methods(company_id, 'harvester', completed=True)
-            return 0
-
     except Exception as e:
         print(f"{thread_prefix}  Error processing {company_name}: {e}")
         # Mark as attempted but not completed
-        db_manager.update_company_methods(company_id, 'harvester', completed=False)
-        return 0
+        return [], False
+
+    if emails:
+        print(f"{thread_prefix}  Harvested {len(emails)} emails")
+
+        # Show all emails found
+        for email_result in emails:
+            print(f"{thread_prefix}    - {email_result.email}")
+    else:
+        print(f"{thread_prefix}  No emails harvested for {website}")
+
+    # Completed even if no emails were found
+    return emails, True
 
 def process_all_companies_from_db(harvester, db_path, table_name, limit=None, offset=0, max_threads=2):
     """Process all companies from database using threading."""
-    import sqlite3
-    import time
-    from concurrent.futures import ThreadPoolExecutor, as_completed
 
     # Load database column configuration
-    geo_config = load_geo_mail_config()
-    db_config = get_database_column_config(geo_config)
+    db_config = _get_db_column_config()
 
     # Initialize database manager for storing results and ensure schema
-    # Get the correct path to addons directory
-    current_file = os.path.abspath(__file__)
-    harvester_dir = os.path.dirname(current_file)        # addons/mail-harvester
-    addons_dir = os.path.dirname(harvester_dir)          # addons
-
-    # Import directly from the addons directory
-    import importlib.util
-    db_manager_path = os.path.join(addons_dir, 'database_manager.py')
-    spec = importlib.util.spec_from_file_location("database_manager", db_manager_path)
-    database_manager_module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(database_manager_module)
-    EmailDatabaseManager = database_manager_module.EmailDatabaseManager
-    db_manager = EmailDatabaseManager(db_path, db_config['id_column'])
+    EmailDatabaseManager = _load_db_manager()
+    db_manager = EmailDatabaseManager(db_path, db_config['id_column'], table_name=table_name)
 
     # Ensure both emails table and companies table have required columns
     db_manager.ensure_emails_table()
     db_manager.ensure_companies_table_columns()
 
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-
-    # Get companies that need harvester email generation
+    # Get companies that need harvester email generation. Completed methods are
+    # looked up in the company_methods table (primary key on company_id, method)
+    # instead of parsing every company's email_methods_completed JSON
+    id_column = db_config['id_column']
+    website_column = db_config['website_column']
     query = f"""
-        SELECT id, name, website
-        FROM {table_name}
-        WHERE website IS NOT NULL
-        AND website != ''
-        AND website != 'N/A'
-        AND website NOT LIKE '%N/A%'
-        AND website NOT LIKE 'n'
-        AND website NOT LIKE 'N'
-        AND (
-            email_methods_completed IS NULL
-            OR email_methods_completed = '[]'
-            OR json_extract(email_methods_completed, '$') NOT LIKE '%"harvester"%'
-        )
-        ORDER BY id ASC
+        SELECT c.{id_column}, c.{db_config['name_column']}, c.{website_column}
+        FROM {table_name} c
+        LEFT JOIN company_methods cm
+            ON cm.company_id = c.{id_column} AND cm.method = 'harvester'
+        WHERE c.{website_column} IS NOT NULL
+        AND c.{website_column} != ''
+        AND c.{website_column} != 'N/A'
+        AND c.{website_column} NOT LIKE '%N/A%'
+        AND c.{website_column} NOT LIKE 'n'
+        AND c.{website_column} NOT LIKE 'N'
+        AND cm.company_id IS NULL
+        ORDER BY c.{id_column} ASC
     """
+    params = []
 
-    if offset:
-        query += f" OFFSET {offset}"
-    if limit:
-        query += f" LIMIT {limit}"
+    if limit or offset:
+        # SQLite needs a LIMIT before OFFSET; -1 means no limit
+        query += " LIMIT ? OFFSET ?"
+        params += [limit or -1, offset or 0]
 
-    cursor.execute(query)
-    companies = cursor.fetchall()
-    conn.close()
+    # Read on the manager's pooled WAL connection instead of opening another one
+    with db_manager.get_connection(readonly=True) as conn:
+        companies = [tuple(row) for row in conn.execute(query, params)]
 
     if not companies:
         logger.info("No companies found that need harvester email generation")
+        db_manager.close()
         return
 
     logger.info(f"Processing {len(companies)} companies for email harvesting using {max_threads} threads...")
@@ -467,32 +468,65 @@ def process_all_companies_from_db(harvester, db_path, table_name, limit=None, of
     total_emails_harvested = 0
     completed_count = 0
 
-    # Use ThreadPoolExecutor for concurrent processing
-    with ThreadPoolExecutor(max_workers=max_threads) as executor:
-        # Submit all tasks
-        future_to_company = {}
-        for i, company_data in enumerate(companies):
-            thread_id = (i % max_threads) + 1
-            future = executor.submit(process_single_company_harvester, harvester, company_data, db_path, thread_id)
-            future_to_company[future] = company_data
+    # The addon's pool is reused across runs; theHarvester subprocesses do the
+    # waiting, so completions are handled as soon as they arrive
+    executor = harvester._get_executor(max_threads)
+
+    # Submit all tasks
+    future_to_company = {}
+    for i, company_data in enumerate(companies):
+        thread_id = (i % max_threads) + 1
+        future = executor.submit(process_single_company_harvester, harvester, company_data, thread_id)
+        future_to_company[future] = company_data
+
+    # Results are stored from this thread only, several companies per transaction
+    pending_emails = {}  # company_id -> emails not yet stored
+    pending_methods = {True: [], False: []}  # completed -> [(company_id, 'harvester')]
+    last_write = time.monotonic()
+    total_stored = 0
+
+    def write_pending():
+        nonlocal last_write, total_stored
+        last_write = time.monotonic()
+        # Emails first, so a company is never marked done without its emails. If
+        # they can't be stored, everything stays buffered for the next write
+        try:
+            total_stored += db_manager.add_emails_batch(pending_emails, raise_on_error=True)
+        except sqlite3.Error as e:
+            logger.error(f"Could not store harvested emails, will retry: {e}")
+            return
+        for completed, company_methods in pending_methods.items():
+            if company_methods:
+                db_manager.update_company_methods_batch(company_methods, completed=completed)
+                company_methods.clear()
+        pending_emails.clear()
 
+    try:
         # Process completed tasks
         for future in as_completed(future_to_company):
             company_data = future_to_company[future]
-            _, company_name, _ = company_data  # Unpack only what we need
+            company_id, company_name, _ = company_data  # Unpack only what we need
             completed_count += 1
 
             try:
-                emails_count = future.result()
-                total_emails_harvested += emails_count
+                emails, completed = future.result()
+                if emails:
+                    pending_emails[company_id] = emails
+                pending_methods[completed].append((company_id, 'harvester'))
+                total_emails_harvested += len(emails)
                 print(f"[{completed_count}/{len(companies)}] Completed: {company_name}")
             except Exception as e:
                 print(f"[{completed_count}/{len(companies)}] Failed: {company_name} - {e}")
 
-            # Small delay between processing completions to be respectful
-            time.sleep(1)
+            if (len(pending_methods[True]) + len(pending_methods[False]) >= HARVEST_WRITE_BATCH
+                    or time.monotonic() - last_write >= HARVEST_WRITE_INTERVAL):
+                write_pending()
+    finally:
+        # Keep what was harvested even if the run is interrupted
+        write_pending()
+        db_manager.close()
 
-    print(f"\nCompleted! Harvested {total_emails_harvested} total emails for {len(companies)} companies using {max_threads} threads")
+    print(f"\nCompleted! Harvested {total_emails_harvested} total emails ({total_stored} new) for {len(companies)} companies using {max_threads} threads")
 
 def main():
     """Main function for standalone usage."""
@@ -536,79 +570,79 @@ def main():
     # Use command line threads argument if provided, otherwise use config value
     threads_to_use = args.threads if args.threads is not None else config_threads
 
-    harvester = MailHarvesterAddon(config)
-
-    if not harvester.setup():
-        print("Setup failed!")
-        sys.exit(1)
-
-    if args.domain:
-        # Process specific domain
-        company = CompanyInfo(
-            id=0,
-            name="Test Company",
-            website=args.domain
-        )
-
-        emails = harvester.find_emails(company)
-
-        print(f"\nFound {len(emails)} emails for {args.domain}:")
-        for email_result in emails:
-            print(f"  {email_result.email}")
-
-    elif args.all_companies:
-        # Process all companies from geo_mail database
-        geo_config = load_geo_mail_config()
-        db_name = geo_config.get("Database", "db_name", fallback="google_maps_companies.db")
-        table_name = geo_config.get("Email", "table_name", fallback="companies")
-
-        # Construct full database path (go up two levels from addons/mail-harvester to geo_mail root)
-        geo_mail_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-        db_path = os.path.join(geo_mail_root, db_name)
-
-        print(f"Using database: {db_path}")
-        print(f"Using table: {table_name}")
-        print(f"Using sources: {args.sources}")
-        print(f"Thread count: {threads_to_use}")
-
-        process_all_companies_from_db(harvester, db_path, table_name, args.limit, args.offset, threads_to_use)
+    # Stops the worker threads however the command ends
+    with MailHarvesterAddon(config) as harvester:
+        if not harvester.setup():
+            print("Setup failed!")
+            sys.exit(1)
+
+        if args.domain:
+            # Process specific domain
+            company = CompanyInfo(
+                id=0,
+                name="Test Company",
+                website=args.domain
+            )
 
-    elif args.company_id:
-        # Process single company from database
-        geo_config = load_geo_mail_config()
-        db_name = geo_config.get("Database", "db_name", fallback="google_maps_companies.db")
-        table_name = geo_config.get("Email", "table_name", fallback="companies")
-        geo_mail_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-        db_path = os.path.join(geo_mail_root, db_name)
-
-        import sqlite3
-        conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
-        cursor.execute(f"SELECT id, name, website FROM {table_name} WHERE id = ?", (args.company_id,))
-        result = cursor.fetchone()
-        conn.close()
-
-        if result:
-            company_id, company_name, website = result
-            company = CompanyInfo(id=company_id, name=company_name, website=website)
             emails = harvester.find_emails(company)
 
-            print(f"Harvested {len(emails)} emails for company {company_id} ({company_name}):")
+            print(f"\nFound {len(emails)} emails for {args.domain}:")
             for email_result in emails:
                 print(f"  {email_result.email}")
-        else:
-            print(f"Company with ID {args.company_id} not found")
 
-    else:
-        print("Usage:")
-        print("  --domain DOMAIN                    Harvest for specific domain")
-        print("  --all-companies                    Process all unprocessed companies from geo_mail database")
-        print("  --company-id ID                    Process specific company from database")
-        print("  --limit N                          Limit number of companies (optional - processes all if not set)")
-        print("  --offset N                         Offset for database query")
-        print("  --sources SOURCE1 SOURCE2         theHarvester sources to use")
-        print("  --threads N                        Number of concurrent threads (default: from config.ini)")
-        sys.exit(1)
+        elif args.all_companies:
+            # Process all companies from geo_mail database
+            geo_config = load_geo_mail_config()
+            db_name = geo_config.get("Database", "db_name", fallback="google_maps_companies.db")
+            table_name = geo_config.get("Email", "table_name", fallback="companies")
+
+            # Construct full database path (go up two levels from addons/mail-harvester to geo_mail root)
+            geo_mail_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+            db_path = os.path.join(geo_mail_root, db_name)
+
+            print(f"Using database: {db_path}")
+            print(f"Using table: {table_name}")
+            print(f"Using sources: {args.sources}")
+            print(f"Thread count: {threads_to_use}")
+
+            process_all_companies_from_db(harvester, db_path, table_name, args.limit, args.offset, threads_to_use)
+
+        elif args.company_id:
+            # Process single company from database
+            geo_config = load_geo_mail_config()
+            db_name = geo_config.get("Database", "db_name", fallback="google_maps_companies.db")
+            table_name = geo_config.get("Email", "table_name", fallback="companies")
+            geo_mail_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+            db_path = os.path.join(geo_mail_root, db_name)
+
+            import sqlite3
+            conn = sqlite3.connect(db_path)
+            cursor = conn.cursor()
+            cursor.execute(f"SELECT id, name, website FROM {table_name} WHERE id = ?", (args.company_id,))
+            result = cursor.fetchone()
+            conn.close()
+
+            if result:
+                company_id, company_name, website = result
+                company = CompanyInfo(id=company_id, name=company_name, website=website)
+                emails = harvester.find_emails(company)
+
+                print(f"Harvested {len(emails)} emails for company {company_id} ({company_name}):")
+                for email_result in emails:
+                    print(f"  {email_result.email}")
+            else:
+                print(f"Company with ID {args.company_id} not found")
+
+        else:
+            print("Usage:")
+            print("  --domain DOMAIN                    Harvest for specific domain")
+            print("  --all-companies                    Process all unprocessed companies from geo_mail database")
+            print("  --company-id ID                    Process specific company from database")
+            print("  --limit N                          Limit number of companies (optional - processes all if not set)")
+            print("  --offset N                         Offset for database query")
+            print("  --sources SOURCE1 SOURCE2         theHarvester sources to use")
+            print("  --threads N                        Number of concurrent threads (default: from config.ini)")
+            sys.exit(1)
 
 if __name__ == "__main__":
     main()
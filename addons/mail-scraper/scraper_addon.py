@@ -468,7 +468,7 @@ def process_single_company(scraper, company_data, db_path, thread_id=None):
         
         # Combine scraped emails with existing emails (remove duplicates)
         all_emails = list(scraped_emails)  # Start with scraped emails
-        scraped_email_set = {email.email.lower() for email in scraped_emails}
+        scraped_email_set = {email.email for email in scraped_emails}
         
         # Add existing emails that aren't already found by scraping
         for existing_email in existing_emails:
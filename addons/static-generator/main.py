@@ -377,7 +377,7 @@ def process_all_companies_from_db(generator, db_path, table_name=None, limit=Non
             
             # Combine generated emails with existing emails (remove duplicates)
             all_emails = list(generated_emails)  # Start with generated emails
-            generated_email_set = {email.email.lower() for email in generated_emails}
+            generated_email_set = {email.email for email in generated_emails}
             
             # Add existing emails that aren't already generated
             for existing_email in existing_emails:
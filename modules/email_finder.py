@@ -41,6 +41,11 @@ from addons.database_manager import EmailDatabaseManager
 
 logger = setup_logging()
 
+def _add_addon_path(addon_dir: str):
+    """Put an addon directory on sys.path once, however often addons are initialized."""
+    if addon_dir not in sys.path:
+        sys.path.append(addon_dir)
+
 class EmailFinder:
     """
     Modern email finder that uses the addon system for email discovery.
@@ -88,8 +93,7 @@ class EmailFinder:
         # Initialize static generator addon
         if 'static' in self.enabled_methods and self.config.getboolean("EmailFinders", "static_enabled", fallback=True):
             try:
-                import sys
-                sys.path.append('addons/static-generator')
+                _add_addon_path('addons/static-generator')
                 from main import StaticEmailGenerator
                 static_config = {
                     'patterns': [p.strip() for p in self.config.get("EmailFinders", "static_patterns", fallback="info,contact").split(",")],
@@ -105,7 +109,7 @@ class EmailFinder:
         # Initialize harvester addon
         if 'harvester' in self.enabled_methods and self.config.getboolean("EmailFinders", "harvester_enabled", fallback=True):
             try:
-                sys.path.append('addons/mail-harvester')
+                _add_addon_path('addons/mail-harvester')
                 from harvester_addon import MailHarvesterAddon
                 harvester_config = {
                     'sources': [s.strip() for s in self.config.get("EmailFinders", "harvester_sources", fallback="bing,duckduckgo").split(",")],
@@ -122,7 +126,7 @@ class EmailFinder:
         # Initialize scraper addon
         if 'scraper' in self.enabled_methods and self.config.getboolean("EmailFinders", "scraper_enabled", fallback=False):
             try:
-                sys.path.append('addons/mail-scraper')
+                _add_addon_path('addons/mail-scraper')
                 from scraper_addon import MailScraperAddon
                 scraper_config = {
                     'depth': self.config.getint("EmailFinders", "scraper_depth", fallback=1),
@@ -140,13 +144,16 @@ class EmailFinder:
         # Initialize email checker if inline checking is enabled
         if self.check_inline and self.config.getboolean("EmailChecker", "enabled", fallback=True):
             try:
-                sys.path.append('addons/mail-checker')
+                _add_addon_path('addons/mail-checker')
                 from checker_addon import MailCheckerAddon
                 checker_config = {
                     'api_endpoint': self.config.get("EmailChecker", "api_endpoint", fallback="http://localhost:8080/v0/check_email"),
                     'batch_size': self.config.getint("EmailChecker", "batch_size", fallback=200),
                     'max_workers': self.config.getint("EmailChecker", "max_workers", fallback=10),
-                    'api_timeout': self.config.getint("EmailChecker", "api_timeout", fallback=3600)
+                    'api_timeout': self.config.getint("EmailChecker", "api_timeout", fallback=3600),
+                    'api_retries': self.config.getint("EmailChecker", "api_retries", fallback=3),
+                    'max_per_second': self.config.getfloat("EmailChecker", "max_per_second", fallback=0),
+                    'target_per_second': self.config.getfloat("EmailChecker", "target_per_second", fallback=0)
                 }
                 self.addons['checker'] = MailCheckerAddon(checker_config)
                 logger.info("Mail checker addon initialized for inline checking")
@@ -25,16 +25,28 @@
 # For complete documentation, visit: https://github.com/ScrapeKaBaap/GMap
 # ================================================================================
 
+import heapq
 import logging
 import os
 import shutil
 import sys
 from datetime import datetime
+from operator import itemgetter
 from modules.config_manager import ConfigManager
 
 # Get the base directory (project root - parent of modules directory)
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
+class _ExactLevelFilter(logging.Filter):
+    """Pass only records of exactly one level (compared by levelno)."""
+    
+    def __init__(self, levelno):
+        super().__init__()
+        self.levelno = levelno
+    
+    def filter(self, record):
+        return record.levelno == self.levelno
+
 def setup_logging():
     """Sets up multi-level logging configuration with separate files per log level in timestamped folders."""
     config_manager = ConfigManager()
@@ -44,13 +56,10 @@ def setup_logging():
     if not os.path.isabs(log_dir):
         log_dir = os.path.join(BASE_DIR, log_dir)
     
-    # Create main logs directory if it doesn't exist
-    if not os.path.exists(log_dir):
-        os.makedirs(log_dir)
-    
     # Generate timestamped run folder with cleaner naming: YYYY-MM-DD_HHMMSS
     timestamp = datetime.now().strftime("%Y-%m-%d_%H%M%S")
     run_folder = os.path.join(log_dir, timestamp)
+    # Creates the logs directory too; no separate existence check needed
     os.makedirs(run_folder, exist_ok=True)
     
     # Get logging configuration
@@ -63,6 +72,9 @@ def setup_logging():
     for handler in root_logger.handlers[:]:
         root_logger.removeHandler(handler)
     
+    # One formatter shared by every handler
+    formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(module)s - %(message)s")
+    
     # Set up file handlers for each log level
     file_handlers = []
     log_files = {}
@@ -75,10 +87,10 @@ def setup_logging():
             # Create file handler
             file_handler = logging.FileHandler(log_file)
             file_handler.setLevel(getattr(logging, level))
-            file_handler.setFormatter(logging.Formatter("%(asctime)s - %(levelname)s - %(module)s - %(message)s"))
+            file_handler.setFormatter(formatter)
             
             # Add filter to only show this level
-            file_handler.addFilter(lambda record, lvl=level: record.levelname == lvl)
+            file_handler.addFilter(_ExactLevelFilter(getattr(logging, level)))
             file_handlers.append(file_handler)
     
     # Create console handler with configured level
@@ -87,14 +99,14 @@ def setup_logging():
         console_handler.setLevel(getattr(logging, console_level))
     except AttributeError:
         console_handler.setLevel(logging.INFO)
-    console_handler.setFormatter(logging.Formatter("%(asctime)s - %(levelname)s - %(module)s - %(message)s"))
+    console_handler.setFormatter(formatter)
     
     # Create "all" log file that contains everything
     all_log_file = os.path.join(run_folder, "all.log")
     log_files["ALL"] = all_log_file
     all_handler = logging.FileHandler(all_log_file)
     all_handler.setLevel(logging.DEBUG)
-    all_handler.setFormatter(logging.Formatter("%(asctime)s - %(levelname)s - %(module)s - %(message)s"))
+    all_handler.setFormatter(formatter)
     
     # Configure root logger
     root_logger.setLevel(logging.DEBUG)
@@ -127,22 +139,24 @@ def setup_logging():
 def _cleanup_old_logs(log_dir, max_files_to_keep):
     """Clean up old log folders, keeping only the most recent ones."""
     try:
-        if not os.path.exists(log_dir):
+        # Get all timestamped folders (YYYY-MM-DD_HHMMSS format);
+        # scandir entries carry the file type, so only matching folders are stat'ed
+        try:
+            with os.scandir(log_dir) as entries:
+                log_folders = [
+                    (entry.path, entry.stat().st_ctime)
+                    for entry in entries
+                    if entry.is_dir() and _is_valid_log_folder(entry.name)
+                ]
+        except FileNotFoundError:
             return
         
-        # Get all timestamped folders (YYYY-MM-DD_HHMMSS format)
-        log_folders = []
-        for item in os.listdir(log_dir):
-            item_path = os.path.join(log_dir, item)
-            if os.path.isdir(item_path) and _is_valid_log_folder(item):
-                log_folders.append((item_path, os.path.getctime(item_path)))
-        
-        # Sort by creation time (newest first)
-        log_folders.sort(key=lambda x: x[1], reverse=True)
-        
-        # Remove old folders if we exceed the limit
+        # Remove the oldest folders (by creation time) beyond the limit;
+        # only the removal candidates are selected, no full sort needed
         if len(log_folders) > max_files_to_keep:
-            folders_to_remove = log_folders[max_files_to_keep:]
+            folders_to_remove = heapq.nsmallest(
+                len(log_folders) - max_files_to_keep, log_folders, key=itemgetter(1)
+            )
             for folder_path, _ in folders_to_remove:
                 try:
                     shutil.rmtree(folder_path)
@@ -155,6 +169,10 @@ def _cleanup_old_logs(log_dir, max_files_to_keep):
 
 def _is_valid_log_folder(folder_name):
     """Check if folder name matches the expected timestamped format: YYYY-MM-DD_HHMMSS."""
+    # Cheap shape check first so unrelated entries never reach strptime
+    if len(folder_name) != 17 or folder_name[4] != '-' or folder_name[7] != '-' or folder_name[10] != '_':
+        return False
+    
     try:
         # Try to parse the folder name as a timestamp
         datetime.strptime(folder_name, "%Y-%m-%d_%H%M%S")
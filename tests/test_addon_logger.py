@@ -0,0 +1,81 @@
+# ================================================================================
+# GMap - Professional Google Maps Scraper & Email Discovery Platform
+# ================================================================================
+#
+# Author: Krishna Kushwaha
+# GitHub: https://github.com/krishna-kush
+# Project: GMap - Automated Google Maps Scraping + Email Discovery System
+# Repository: https://github.com/ScrapeKaBaap/GMap
+#
+# Description: Enterprise-grade business intelligence platform that combines
+#              automated Google Maps scraping with advanced email discovery
+#              techniques to build targeted business contact databases.
+#
+# Components: - Google Maps Company Scraper
+#             - Multi-Method Email Discovery (Static, Harvester, Scraper, Checker)
+#             - Professional Database Management
+#             - Advanced Configuration & Logging System
+#
+# License: MIT License
+# Created: 2025
+#
+# ================================================================================
+# This file is part of the GMap project.
+# For complete documentation, visit: https://github.com/ScrapeKaBaap/GMap
+# ================================================================================
+
+import unittest
+import logging
+import os
+import sys
+import tempfile
+
+# Import addon modules - ensure they are designed to be called externally
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "addons"))
+
+from addon_logger import setup_addon_logging
+
+class TestAddonLogger(unittest.TestCase):
+    def setUp(self):
+        self.log_dir = tempfile.mkdtemp()
+        self.logger = setup_addon_logging("test-addon", self.log_dir)
+        self.run_folder = os.path.join(self.log_dir, os.listdir(self.log_dir)[0])
+
+    def tearDown(self):
+        for handler in self.logger.handlers[:]:
+            self.logger.removeHandler(handler)
+            handler.close()
+
+    def _read_log(self, name):
+        for handler in self.logger.handlers:
+            handler.flush()
+        with open(os.path.join(self.run_folder, name)) as f:
+            return f.read()
+
+    def test_records_split_by_level(self):
+        self.logger.debug("debug message")
+        self.logger.warning("warning message")
+
+        debug_log = self._read_log("debug.log")
+        warning_log = self._read_log("warning.log")
+        self.assertIn("debug message", debug_log)
+        self.assertNotIn("warning message", debug_log)
+        self.assertIn("warning message", warning_log)
+        self.assertNotIn("debug message", warning_log)
+
+    def test_all_log_contains_every_level(self):
+        self.logger.debug("debug message")
+        self.logger.error("error message")
+
+        all_log = self._read_log("all.log")
+        self.assertIn("debug message", all_log)
+        self.assertIn("error message", all_log)
+
+    def test_errors_flushed_without_explicit_flush(self):
+        self.logger.error("error message")
+
+        with open(os.path.join(self.run_folder, "error.log")) as f:
+            self.assertIn("error message", f.read())
+
+if __name__ == "__main__":
+    unittest.main()
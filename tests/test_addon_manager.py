@@ -0,0 +1,95 @@
+# ================================================================================
+# GMap - Professional Google Maps Scraper & Email Discovery Platform
+# ================================================================================
+#
+# Author: Krishna Kushwaha
+# GitHub: https://github.com/krishna-kush
+# Project: GMap - Automated Google Maps Scraping + Email Discovery System
+# Repository: https://github.com/ScrapeKaBaap/GMap
+#
+# Description: Enterprise-grade business intelligence platform that combines
+#              automated Google Maps scraping with advanced email discovery
+#              techniques to build targeted business contact databases.
+#
+# Components: - Google Maps Company Scraper
+#             - Multi-Method Email Discovery (Static, Harvester, Scraper, Checker)
+#             - Professional Database Management
+#             - Advanced Configuration & Logging System
+#
+# License: MIT License
+# Created: 2025
+#
+# ================================================================================
+# This file is part of the GMap project.
+# For complete documentation, visit: https://github.com/ScrapeKaBaap/GMap
+# ================================================================================
+
+
+import unittest
+import os
+import sys
+import threading
+import time
+
+# Import addon modules - ensure they are designed to be called externally
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "addons"))
+
+from addon_manager import AddonManager
+from base_addon import CompanyInfo, EmailFinderAddon, EmailResult
+
+class FailingFinder(EmailFinderAddon):
+    """Finder that fails for company 1 and records every other company."""
+
+    def __init__(self, config=None):
+        super().__init__(config)
+        self.lock = threading.Lock()
+        self.called = []
+
+    def get_source_name(self):
+        return "fake"
+
+    def find_emails(self, company):
+        if company.id == 1:
+            raise RuntimeError("boom")
+        time.sleep(0.05)
+        with self.lock:
+            self.called.append(company.id)
+        return [EmailResult(email=f"info@{company.domain}", source="fake", source_details="test")]
+
+class TestAddonManager(unittest.TestCase):
+    def setUp(self):
+        self.manager = AddonManager({"max_workers": 1})
+        self.finder = FailingFinder()
+        dict.__setitem__(self.manager.finder_addons, "fake", self.finder)
+        self.companies = [CompanyInfo(id=i, name=f"Company {i}", website=f"https://c{i}.com") for i in range(1, 7)]
+
+    def tearDown(self):
+        self.manager.close()
+
+    def test_fail_fast_skips_later_companies(self):
+        results = self.manager.find_emails_batch(self.companies, methods=["fake"], fail_fast=True)
+        # Company 2 may already be running when company 1 fails; the rest are cancelled
+        self.assertLessEqual(len(self.finder.called), 1)
+        self.assertEqual(set(results), {1, *self.finder.called})
+        self.assertEqual(results[1], {"fake": []})
+
+    def test_failure_without_fail_fast_processes_every_company(self):
+        results = self.manager.find_emails_batch(self.companies, methods=["fake"])
+        self.assertEqual(sorted(self.finder.called), [2, 3, 4, 5, 6])
+        self.assertEqual(results[1], {"fake": []})
+        self.assertEqual(results[2]["fake"][0].email, "info@c2.com")
+
+    def test_default_methods_skip_addons_that_fail_to_import(self):
+        self.manager.finder_addons._specs = {
+            "fake": ("test_addon_manager", "FailingFinder", "fake finder", "fake"),
+            "broken": ("no_such_addon_module", "BrokenFinder", "broken finder", "broken"),
+        }
+        self.assertEqual(self.manager.get_available_finders(), ["fake", "broken"])
+        results = self.manager.find_emails_batch(self.companies[1:3])
+        self.assertEqual(set(results[2]), {"fake"})
+        self.assertEqual(self.manager.get_available_finders(), ["fake"])
+        self.assertIsNone(self.manager.finder_addons.get("broken"))
+        self.assertIs(self.manager.finder_addons.get("fake"), self.finder)
+
+if __name__ == "__main__":
+    unittest.main()
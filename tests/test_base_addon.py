@@ -0,0 +1,147 @@
+# ================================================================================
+# GMap - Professional Google Maps Scraper & Email Discovery Platform
+# ================================================================================
+#
+# Author: Krishna Kushwaha
+# GitHub: https://github.com/krishna-kush
+# Project: GMap - Automated Google Maps Scraping + Email Discovery System
+# Repository: https://github.com/ScrapeKaBaap/GMap
+#
+# Description: Enterprise-grade business intelligence platform that combines
+#              automated Google Maps scraping with advanced email discovery
+#              techniques to build targeted business contact databases.
+#
+# Components: - Google Maps Company Scraper
+#             - Multi-Method Email Discovery (Static, Harvester, Scraper, Checker)
+#             - Professional Database Management
+#             - Advanced Configuration & Logging System
+#
+# License: MIT License
+# Created: 2025
+#
+# ================================================================================
+# This file is part of the GMap project.
+# For complete documentation, visit: https://github.com/ScrapeKaBaap/GMap
+# ================================================================================
+
+
+import unittest
+import os
+import sys
+import threading
+import time
+
+# Import addon modules - ensure they are designed to be called externally
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "addons"))
+
+from base_addon import CompanyInfo, EmailCheckerAddon, EmailFinderAddon, EmailResult
+
+class SlowChecker(EmailCheckerAddon):
+    """Checker that records how many checks run at once."""
+
+    def __init__(self, config=None):
+        super().__init__(config)
+        self.lock = threading.Lock()
+        self.running = 0
+        self.max_running = 0
+        self.checked = []
+
+    def get_source_name(self):
+        return "slow"
+
+    def check_email(self, email, company_id=None):
+        domain = email.rsplit("@", 1)[1]
+        cached = self.get_cached_domain_result(domain)
+        if cached is not None:
+            return dict(cached, email=email)
+        with self.lock:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+            self.checked.append(email)
+        time.sleep(0.05)
+        with self.lock:
+            self.running -= 1
+        result = {"email": email, "is_reachable": "safe"}
+        if domain.startswith("nomx"):
+            result["is_reachable"] = "invalid"
+            self.cache_domain_result(domain, result)
+        return result
+
+class SlowFinder(EmailFinderAddon):
+    """Finder that records how many companies run at once."""
+
+    def __init__(self, config=None):
+        super().__init__(config)
+        self.lock = threading.Lock()
+        self.running = 0
+        self.max_running = 0
+
+    def get_source_name(self):
+        return "slow"
+
+    def validate_company(self, company):
+        return bool(company.domain)
+
+    def find_emails(self, company):
+        with self.lock:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        time.sleep(0.05)
+        with self.lock:
+            self.running -= 1
+        if company.id == 2:
+            raise RuntimeError("boom")
+        return [EmailResult(email=f"info@{company.domain}", source="slow", source_details="test")]
+
+class TestEmailFinderAddon(unittest.TestCase):
+    def test_find_emails_batch_runs_on_shared_pool(self):
+        companies = [CompanyInfo(id=i, name=f"Company {i}", website=f"https://c{i}.com") for i in range(1, 7)]
+        companies.append(CompanyInfo(id=7, name="No website", website=""))
+        with SlowFinder({"max_workers": 3}) as finder:
+            results = finder.find_emails_batch(companies)
+            pool = finder._executor
+            finder.find_emails_batch(companies[:2])
+            self.assertIs(finder._executor, pool)
+
+        self.assertEqual(pool._max_workers, 3)
+        self.assertGreater(finder.max_running, 1)
+        self.assertLessEqual(finder.max_running, 3)
+        self.assertEqual(sorted(results), [1, 2, 3, 4, 5, 6, 7])
+        self.assertEqual(results[1][0].email, "info@c1.com")
+        self.assertEqual(results[2], [])
+        self.assertEqual(results[7], [])
+
+class TestEmailCheckerAddon(unittest.TestCase):
+    def test_single_domain_batch_runs_in_parallel(self):
+        emails = [f"user{i}@example.com" for i in range(8)]
+        with SlowChecker({"max_workers": 4}) as checker:
+            results = checker.check_emails_batch(emails)
+        self.assertEqual([r["email"] for r in results], emails)
+        self.assertGreater(checker.max_running, 1)
+
+    def test_cached_domain_result_answers_rest_of_domain(self):
+        emails = ["a@nomx.com", "b@example.com", "b@nomx.com", "c@nomx.com"]
+        with SlowChecker({"max_workers": 4}) as checker:
+            results = checker.check_emails_batch(emails, [1, 2, 3, 4])
+        self.assertEqual([r["email"] for r in results], emails)
+        self.assertEqual([r["is_reachable"] for r in results], ["invalid", "safe", "invalid", "invalid"])
+        self.assertEqual(sorted(checker.checked), ["a@nomx.com", "b@example.com"])
+
+    def test_invalid_syntax_is_not_checked(self):
+        with SlowChecker({"max_workers": 1}) as checker:
+            results = checker.check_emails_batch(["not-an-email", "a@example.com"])
+        self.assertEqual(results[0]["is_reachable"], "invalid")
+        self.assertEqual(checker.checked, ["a@example.com"])
+
+    def test_executor_is_reused_and_resized(self):
+        with SlowChecker({"max_workers": 3}) as checker:
+            pool = checker._get_executor()
+            self.assertIs(checker._get_executor(3), pool)
+            self.assertEqual(pool._max_workers, 3)
+            resized = checker._get_executor(5)
+            self.assertIsNot(resized, pool)
+            self.assertEqual(resized._max_workers, 5)
+        self.assertIsNone(checker._executor)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,313 @@
+# ================================================================================
+# GMap - Professional Google Maps Scraper & Email Discovery Platform
+# ================================================================================
+#
+# Author: Krishna Kushwaha
+# GitHub: https://github.com/krishna-kush
+# Project: GMap - Automated Google Maps Scraping + Email Discovery System
+# Repository: https://github.com/ScrapeKaBaap/GMap
+#
+# Description: Enterprise-grade business intelligence platform that combines
+#              automated Google Maps scraping with advanced email discovery
+#              techniques to build targeted business contact databases.
+#
+# Components: - Google Maps Company Scraper
+#             - Multi-Method Email Discovery (Static, Harvester, Scraper, Checker)
+#             - Professional Database Management
+#             - Advanced Configuration & Logging System
+#
+# License: MIT License
+# Created: 2025
+#
+# ================================================================================
+# This file is part of the GMap project.
+# For complete documentation, visit: https://github.com/ScrapeKaBaap/GMap
+# ================================================================================
+
+import unittest
+import json
+import os
+import sqlite3
+import sys
+import tempfile
+from datetime import datetime, timedelta
+
+# Import addon modules - ensure they are designed to be called externally
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "addons"))
+
+from database_manager import EmailDatabaseManager
+from base_addon import CheckResult, EmailResult
+
+class TestEmailDatabaseManager(unittest.TestCase):
+    def setUp(self):
+        fd, self.db_file = tempfile.mkstemp(suffix=".db")
+        os.close(fd)
+        self.db_manager = EmailDatabaseManager(self.db_file)
+        self.db_manager.ensure_emails_table()
+
+    def tearDown(self):
+        self.db_manager.close()
+        os.remove(self.db_file)
+
+    def _add_emails(self, company_id, *emails):
+        results = [EmailResult(email=email, source="static", source_details="test") for email in emails]
+        return self.db_manager.add_emails_batch({company_id: results})
+
+    def test_connection_is_shared_and_uses_wal(self):
+        with self.db_manager.get_connection() as first:
+            mode = first.execute("PRAGMA journal_mode").fetchone()[0]
+        with self.db_manager.get_connection() as second:
+            self.assertIs(first, second)
+        self.assertEqual(mode, "wal")
+
+    def test_connections_are_reused_until_closed(self):
+        with self.db_manager.get_connection(readonly=True) as first:
+            pass
+        with self.db_manager.get_connection(readonly=True) as second:
+            self.assertIs(first, second)
+
+        # A closed manager reopens its connections on next use
+        self.db_manager.close()
+        self.assertEqual(self._add_emails(1, "info@example.com"), 1)
+        self.assertEqual(self.db_manager.count_unchecked_emails(), 1)
+
+    def test_failed_block_is_rolled_back(self):
+        with self.assertRaises(RuntimeError):
+            with self.db_manager.get_connection() as conn:
+                conn.execute("INSERT INTO emails (company_id, email, source) VALUES (1, 'a@b.com', 'static')")
+                raise RuntimeError("boom")
+        self.assertEqual(self.db_manager.get_company_emails(1), [])
+
+    def test_readonly_connection_sees_committed_writes_and_rejects_writes(self):
+        self._add_emails(1, "info@example.com")
+        with self.db_manager.get_connection(readonly=True) as conn:
+            self.assertEqual(conn.execute("SELECT COUNT(*) FROM emails").fetchone()[0], 1)
+            with self.assertRaises(sqlite3.OperationalError):
+                conn.execute("DELETE FROM emails")
+
+    def test_add_emails_batch_ignores_duplicates(self):
+        self.assertEqual(self._add_emails(1, "info@example.com", "sales@example.com"), 2)
+        self.assertEqual(self._add_emails(1, "info@example.com"), 0)
+        self.assertEqual(len(self.db_manager.get_company_emails(1)), 2)
+
+    def test_add_emails_batch_stores_metadata_as_json(self):
+        self.db_manager.add_emails_batch({1: [
+            EmailResult(email="info@example.com", source="static", source_details="test", metadata={"pattern": "info"}),
+            EmailResult(email="sales@example.com", source="static", source_details="test"),
+        ]})
+        emails = {row['email']: row for row in self.db_manager.get_company_emails(1)}
+        self.assertEqual(json.loads(emails["info@example.com"]['metadata']), {"pattern": "info"})
+        self.assertIsNone(emails["sales@example.com"]['metadata'])
+
+    def test_add_emails_batch_failure_returns_zero_or_raises(self):
+        with self.db_manager.get_connection() as conn:
+            conn.execute("DROP TABLE emails")
+        results = {1: [EmailResult(email="info@example.com", source="static", source_details="test")]}
+        self.assertEqual(self.db_manager.add_emails_batch(results), 0)
+        with self.assertRaises(sqlite3.Error):
+            self.db_manager.add_emails_batch(results, raise_on_error=True)
+
+    def test_iter_unchecked_emails_and_count(self):
+        self._add_emails(1, "info@example.com", "sales@example.com")
+        self.assertEqual(self.db_manager.count_unchecked_emails(), 2)
+
+        emails = self.db_manager.iter_unchecked_emails()
+        first = next(emails)
+        self.assertIn(first['email'], ("info@example.com", "sales@example.com"))
+        emails.close()
+
+        self.assertEqual(self.db_manager.count_unchecked_emails(source="harvester"), 0)
+        self.assertEqual(len(self.db_manager.get_unchecked_emails(limit=1)), 1)
+
+    def test_unchecked_emails_are_read_in_index_order(self):
+        with self.db_manager.get_connection(readonly=True) as conn:
+            plan = " ".join(row[3] for row in conn.execute(
+                "EXPLAIN QUERY PLAN SELECT * FROM emails WHERE checked_at IS NULL ORDER BY created_at ASC"
+            ))
+        self.assertIn("idx_emails_checked_created", plan)
+        self.assertNotIn("TEMP B-TREE", plan)
+
+    def test_redundant_checked_at_index_is_dropped(self):
+        with self.db_manager.get_connection() as conn:
+            conn.execute("CREATE INDEX idx_emails_checked_at ON emails (checked_at)")
+            conn.commit()
+        self.assertTrue(self.db_manager.ensure_emails_table())
+        with self.db_manager.get_connection(readonly=True) as conn:
+            indexes = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+        self.assertNotIn("idx_emails_checked_at", indexes)
+        self.assertIn("idx_emails_checked_created", indexes)
+
+    def test_claim_unchecked_emails(self):
+        self._add_emails(1, "info@example.com", "sales@example.com", "hr@example.com")
+
+        first = self.db_manager.claim_unchecked_emails("run-a", 2)
+        self.assertEqual(len(first), 2)
+        # Another run only gets the rows nobody holds
+        second = self.db_manager.claim_unchecked_emails("run-b", 5)
+        self.assertEqual(len(second), 1)
+        self.assertNotIn(second[0]['id'], {email['id'] for email in first})
+        self.assertEqual(self.db_manager.claim_unchecked_emails("run-c", 5), [])
+
+        # Expired claims are taken over; checked rows never come back
+        self.db_manager.update_email_check_results_batch([(first[0]['id'], {'is_reachable': 'safe'})])
+        taken_over = self.db_manager.claim_unchecked_emails("run-c", 5, ttl=-1)
+        self.assertEqual(len(taken_over), 2)
+
+        self.assertEqual(self.db_manager.release_email_claims("run-c"), 2)
+        self.assertEqual(len(self.db_manager.claim_unchecked_emails("run-d", 5, source="static")), 2)
+
+    def test_expired_claim_is_taken_over(self):
+        self._add_emails(1, "info@example.com", "sales@example.com")
+        stale, fresh = self.db_manager.claim_unchecked_emails("run-a", 2)
+
+        # run-a has held one of its rows for two hours
+        with self.db_manager.get_connection() as conn:
+            conn.execute("UPDATE emails SET claimed_at = ? WHERE id = ?",
+                         (datetime.now() - timedelta(hours=2), stale['id']))
+            conn.commit()
+
+        taken_over = self.db_manager.claim_unchecked_emails("run-b", 5, ttl=3600)
+        self.assertEqual([email['id'] for email in taken_over], [stale['id']])
+        self.assertEqual(self.db_manager.release_email_claims("run-a"), 1)
+
+    def test_get_email_stats(self):
+        self.assertEqual(self.db_manager.get_email_stats()['total_emails'], 0)
+        self._add_emails(1, "info@example.com", "sales@example.com")
+        self.db_manager.add_emails_batch({2: [EmailResult(email="a@b.com", source="harvester", source_details="bing")]})
+        email_ids = self.db_manager.get_email_ids_for_companies([1])
+        self.db_manager.update_email_check_results_batch([(email_ids[(1, "info@example.com")], {'is_reachable': 'safe'})])
+
+        stats = self.db_manager.get_email_stats()
+        self.assertEqual(stats['by_source'], {'static': 2, 'harvester': 1})
+        self.assertEqual(stats['total_emails'], 3)
+        self.assertEqual(stats['checked_emails'], 1)
+        self.assertEqual(stats['unchecked_emails'], 2)
+        self.assertEqual(stats['companies_with_emails'], 2)
+
+    def test_get_email_ids_for_companies(self):
+        self._add_emails(1, "Info@Example.com")
+        self._add_emails(2, "info@example.com")
+
+        email_ids = self.db_manager.get_email_ids_for_companies([1, 2, 3])
+        self.assertEqual(set(email_ids), {(1, "info@example.com"), (2, "info@example.com")})
+        self.assertNotEqual(email_ids[(1, "info@example.com")], email_ids[(2, "info@example.com")])
+
+    def test_update_email_check_results_batch(self):
+        self._add_emails(1, "info@example.com", "sales@example.com")
+        email_ids = self.db_manager.get_email_ids_for_companies([1])
+        info_id = email_ids[(1, "info@example.com")]
+        sales_id = email_ids[(1, "sales@example.com")]
+
+        updated = self.db_manager.update_email_check_results_batch([
+            (info_id, {'is_reachable': 'safe', 'records': ['mx1.example.com']}),
+            (sales_id, {'check_error': 'timeout'}),
+        ])
+        self.assertEqual(updated, 2)
+
+        emails = {row['email']: row for row in self.db_manager.get_company_emails(1)}
+        self.assertEqual(emails["info@example.com"]['is_reachable'], 'safe')
+        self.assertEqual(emails["info@example.com"]['records'], '["mx1.example.com"]')
+        self.assertIsNone(emails["info@example.com"]['check_error'])
+        self.assertEqual(emails["sales@example.com"]['check_error'], 'timeout')
+        self.assertIsNotNone(emails["sales@example.com"]['checked_at'])
+
+        # A later check replaces the whole previous result
+        self.db_manager.update_email_check_results_batch([(sales_id, {'is_reachable': 'risky'})])
+        sales = self.db_manager.get_company_emails(1, source="static")
+        sales = next(row for row in sales if row['email'] == "sales@example.com")
+        self.assertEqual(sales['is_reachable'], 'risky')
+        self.assertIsNone(sales['check_error'])
+
+    def test_update_email_check_results_writes_given_fields_only(self):
+        self._add_emails(1, "info@example.com")
+        info_id = self.db_manager.get_email_ids_for_companies([1])[(1, "info@example.com")]
+
+        self.assertTrue(self.db_manager.update_email_check_results(info_id, {'is_reachable': 'safe', 'records': ['mx1']}))
+        self.assertTrue(self.db_manager.update_email_check_results(info_id, {'is_disposable': False}))
+
+        info = self.db_manager.get_company_emails(1)[0]
+        self.assertEqual(info['is_reachable'], 'safe')
+        self.assertEqual(info['records'], '["mx1"]')
+        self.assertEqual(info['is_disposable'], 0)
+        self.assertFalse(self.db_manager.update_email_check_results(info_id + 1, {'is_reachable': 'safe'}))
+
+    def test_update_email_check_results_batch_with_check_result(self):
+        self._add_emails(1, "info@example.com")
+        info_id = self.db_manager.get_email_ids_for_companies([1])[(1, "info@example.com")]
+
+        updated = self.db_manager.update_email_check_results_batch([
+            (info_id, CheckResult(is_reachable='safe', records=['mx1.example.com'], is_deliverable=True)),
+        ])
+        self.assertEqual(updated, 1)
+
+        info = self.db_manager.get_company_emails(1)[0]
+        self.assertEqual(info['is_reachable'], 'safe')
+        self.assertEqual(info['records'], '["mx1.example.com"]')
+        self.assertEqual(info['is_deliverable'], 1)
+        self.assertIsNone(info['check_error'])
+
+    def test_update_company_methods_batch(self):
+        with self.db_manager.get_connection() as conn:
+            conn.execute("CREATE TABLE companies (id INTEGER PRIMARY KEY, name TEXT)")
+            conn.executemany("INSERT INTO companies (id, name) VALUES (?, ?)", [(1, "A"), (2, "B")])
+            conn.commit()
+        self.db_manager.ensure_companies_table_columns()
+        self.db_manager.update_company_methods(1, "static")
+
+        updated = self.db_manager.update_company_methods_batch(
+            [(1, "static"), (1, "harvester"), (2, "static"), (3, "static")]
+        )
+        self.assertEqual(updated, 2)
+
+        with self.db_manager.get_connection() as conn:
+            rows = dict(conn.execute("SELECT id, email_methods_completed FROM companies").fetchall())
+        self.assertEqual(rows[1], '["static", "harvester"]')
+        self.assertEqual(rows[2], '["static"]')
+
+    def test_get_companies_needing_method(self):
+        with self.db_manager.get_connection() as conn:
+            conn.execute("CREATE TABLE companies (id INTEGER PRIMARY KEY, name TEXT, website TEXT)")
+            conn.executemany("INSERT INTO companies (id, name, website) VALUES (?, ?, ?)",
+                             [(1, "A", "a.com"), (2, "B", "b.com"), (3, "C", "")])
+        self.db_manager.ensure_companies_table_columns()
+        self.db_manager.update_company_methods(1, "static")
+        self.db_manager.update_company_methods(2, "static", completed=False)
+
+        self.assertEqual([c.id for c in self.db_manager.get_companies_needing_method("static")], [2])
+        self.assertEqual([c.id for c in self.db_manager.get_companies_needing_method("harvester")], [1, 2])
+
+    def test_company_methods_backfilled_from_json(self):
+        self.db_manager.close()
+        with sqlite3.connect(self.db_file) as conn:
+            conn.execute("DROP TABLE company_methods")
+            conn.execute("CREATE TABLE companies (id INTEGER PRIMARY KEY, name TEXT, website TEXT, "
+                         "email_methods_used TEXT, email_methods_completed TEXT, last_email_scan TIMESTAMP)")
+            conn.executemany("INSERT INTO companies (id, name, website, email_methods_completed) VALUES (?, ?, ?, ?)",
+                             [(1, "A", "a.com", '["static"]'), (2, "B", "b.com", None)])
+        conn.close()
+
+        self.db_manager = EmailDatabaseManager(self.db_file)
+        self.db_manager.ensure_emails_table()
+        self.assertEqual([c.id for c in self.db_manager.get_companies_needing_method("static")], [2])
+
+    def test_configured_companies_table_and_id_column(self):
+        self.db_manager.close()
+        with sqlite3.connect(self.db_file) as conn:
+            conn.execute("DROP TABLE company_methods")
+            conn.execute("CREATE TABLE businesses (business_id INTEGER PRIMARY KEY, name TEXT, website TEXT, "
+                         "email_methods_completed TEXT, last_email_scan TIMESTAMP)")
+            conn.executemany("INSERT INTO businesses (business_id, name, website, email_methods_completed) VALUES (?, ?, ?, ?)",
+                             [(1, "A", "a.com", '["static"]'), (2, "B", "b.com", None), (3, "C", "c.com", None)])
+        conn.close()
+
+        self.db_manager = EmailDatabaseManager(self.db_file, "business_id", table_name="businesses")
+        self.db_manager.ensure_emails_table()
+        self.assertTrue(self.db_manager.ensure_companies_table_columns())
+        self.assertEqual([c.id for c in self.db_manager.get_companies_needing_method("static")], [2, 3])
+
+        self.assertEqual(self.db_manager.update_company_methods_batch([(2, "static")]), 1)
+        self.assertTrue(self.db_manager.update_company_methods(3, "static"))
+        self.assertEqual(self.db_manager.get_companies_needing_method("static"), [])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,156 @@
+# ================================================================================
+# GMap - Professional Google Maps Scraper & Email Discovery Platform
+# ================================================================================
+#
+# Author: Krishna Kushwaha
+# GitHub: https://github.com/krishna-kush
+# Project: GMap - Automated Google Maps Scraping + Email Discovery System
+# Repository: https://github.com/ScrapeKaBaap/GMap
+#
+# Description: Enterprise-grade business intelligence platform that combines
+#              automated Google Maps scraping with advanced email discovery
+#              techniques to build targeted business contact databases.
+#
+# Components: - Google Maps Company Scraper
+#             - Multi-Method Email Discovery (Static, Harvester, Scraper, Checker)
+#             - Professional Database Management
+#             - Advanced Configuration & Logging System
+#
+# License: MIT License
+# Created: 2025
+#
+# ================================================================================
+# This file is part of the GMap project.
+# For complete documentation, visit: https://github.com/ScrapeKaBaap/GMap
+# ================================================================================
+
+
+import unittest
+import json
+import os
+import sqlite3
+import sys
+import tempfile
+
+# Import addon modules - ensure they are designed to be called externally
+ADDONS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "addons")
+sys.path.append(ADDONS_DIR)
+sys.path.append(os.path.join(ADDONS_DIR, "mail-checker"))
+
+from addon_manager import AddonManager
+from base_addon import CompanyInfo, EmailFinderAddon, EmailResult
+from checker_addon import MailCheckerAddon
+
+class InfoFinder(EmailFinderAddon):
+    """Finder that returns info@ and john@ at the company's domain."""
+
+    def get_source_name(self):
+        return "static"
+
+    def find_emails(self, company):
+        return [EmailResult(email=f"{name}@{company.domain}", source="static", source_details="test")
+                for name in ("info", "john")]
+
+class FakeResponse:
+    def __init__(self, payload):
+        self.content = json.dumps(payload).encode()
+
+    def raise_for_status(self):
+        pass
+
+class TestMailCheckerAddon(unittest.TestCase):
+    def setUp(self):
+        self.checker = MailCheckerAddon({"max_workers": 1})
+        self.requests = []
+        self.accepts_mail = False
+        self.checker._send = self._send
+
+    def tearDown(self):
+        self.checker.cleanup()
+
+    def _send(self, data):
+        email = json.loads(data)["to_email"]
+        self.requests.append(email)
+        return FakeResponse({
+            "input": email,
+            "is_reachable": "invalid",
+            "mx": {"accepts_mail": self.accepts_mail, "records": ["mx1.example.com"] if self.accepts_mail else []},
+            "syntax": {"is_valid_syntax": True, "username": email.split("@")[0]},
+            "misc": {"is_role_account": email.startswith("info@"), "is_disposable": False},
+            "smtp": {"can_connect_smtp": False},
+        })
+
+    def test_domain_cache_keeps_only_domain_fields(self):
+        first = self.checker.check_email("info@nomx.com", 1)
+        second = self.checker.check_email("john@nomx.com", 2)
+
+        self.assertEqual(self.requests, ["info@nomx.com"])
+        self.assertEqual(first["syntax"]["username"], "info")
+        self.assertTrue(first["misc"]["is_role_account"])
+        # The second mailbox gets the domain outcome, not the first address's details
+        self.assertEqual(second, {
+            "is_reachable": "invalid",
+            "mx": {"accepts_mail": False, "records": []},
+            "email": "john@nomx.com",
+            "company_id": 2,
+        })
+        self.assertNotIn("email", self.checker.get_cached_domain_result("nomx.com"))
+
+        processed = self.checker.process_email_data(second)
+        self.assertEqual(processed.is_reachable, "invalid")
+        self.assertFalse(processed.mx_accepts_mail)
+        self.assertIsNone(processed.is_role_account)
+
+    def _workflow_manager(self):
+        fd, db_path = tempfile.mkstemp(suffix=".db")
+        os.close(fd)
+        self.addCleanup(os.remove, db_path)
+        with sqlite3.connect(db_path) as conn:
+            conn.execute("CREATE TABLE companies (id INTEGER PRIMARY KEY, name TEXT, website TEXT)")
+            conn.execute("INSERT INTO companies VALUES (1, 'Example', 'https://example.com')")
+        conn.close()
+
+        manager = AddonManager({"max_workers": 1}, db_path)
+        dict.__setitem__(manager.finder_addons, "static", InfoFinder())
+        dict.__setitem__(manager.checker_addons, "checker", self.checker)
+        return manager
+
+    def _run_workflow(self, manager):
+        return manager.process_companies_complete_workflow(
+            [CompanyInfo(id=1, name="Example", website="https://example.com")],
+            finder_methods=["static"], check_emails=True
+        )
+
+    def test_workflow_stores_flat_check_results(self):
+        self.accepts_mail = True
+        with self._workflow_manager() as manager:
+            results = self._run_workflow(manager)
+            emails = {row["email"]: row for row in manager.db_manager.get_company_emails(1)}
+
+        self.assertEqual(results["total_emails_checked"], 2)
+        info = emails["info@example.com"]
+        self.assertEqual(info["is_reachable"], "invalid")
+        self.assertEqual(info["mx_accepts_mail"], 1)
+        self.assertEqual(info["records"], '["mx1.example.com"]')
+        self.assertEqual(info["is_role_account"], 1)
+        self.assertEqual(emails["john@example.com"]["is_role_account"], 0)
+        self.assertEqual(info["is_valid_syntax"], 1)
+
+    def test_workflow_counts_only_stored_check_results(self):
+        self.accepts_mail = True
+        with self._workflow_manager() as manager:
+            lookup = manager.db_manager.get_email_ids_for_companies
+            # john@ has no row to update (e.g. its insert failed)
+            manager.db_manager.get_email_ids_for_companies = lambda company_ids: {
+                key: email_id for key, email_id in lookup(company_ids).items()
+                if key[1] != "john@example.com"
+            }
+            results = self._run_workflow(manager)
+            emails = {row["email"]: row for row in manager.db_manager.get_company_emails(1)}
+
+        self.assertEqual(results["total_emails_checked"], 1)
+        self.assertIsNotNone(emails["info@example.com"]["checked_at"])
+        self.assertIsNone(emails["john@example.com"]["checked_at"])
+
+if __name__ == "__main__":
+    unittest.main()